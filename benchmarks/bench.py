@@ -0,0 +1,168 @@
+"""Performance regression gate: run the extraction and fake-server benchmarks, store the results under the
+current git revision and fail when jobs/sec or peak memory regress against a saved baseline.
+
+    python benchmarks/bench.py --save-baseline     # on main, on the machine that runs the gate
+    python benchmarks/bench.py                     # before deploy; exits 1 on a regression
+
+Baselines are only comparable on the same machine and Python version. Each throughput number is the median of
+several timing windows, and the baseline records how far those windows spread. A drop within that spread is not
+flagged, but the limit never widens past MAX_WIDENING x --threshold, and --save-baseline re-measures, then refuses
+to save, while any case spreads wider than --threshold.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks import bench_extract, bench_fetch  # noqa: E402
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+BASELINE = RESULTS_DIR / "baseline.json"
+
+# Metric name -> True if bigger is better.
+GATED = {"jobs_per_sec": True, "peak_bytes_per_job": False}
+# How far a baseline's own spread may widen --threshold.
+MAX_WIDENING = 2.0
+
+
+def revision() -> str:
+    def git(*args: str) -> str:
+        out = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip()
+
+    try:
+        rev = git("rev-parse", "--short", "HEAD") or "unknown"
+        dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+    except OSError:
+        return "unknown"
+    return f"{rev}-dirty" if dirty else rev
+
+
+def run(jobs: int, fetch_jobs: int, engines: list[str], repeat: int = 9, min_time: float = 0.2) -> dict:
+    report = bench_extract.run(jobs, nesting=3, rounds=5, repeat=repeat, min_time=min_time)
+    runs: dict[str, list[dict]] = {engine: [] for engine in engines}
+    # Median of `repeat` untraced runs per engine, interleaved like the extraction windows, then one traced run
+    # for peak memory.
+    for _ in range(repeat):
+        for engine in engines:
+            runs[engine].append(bench_fetch.run_engine(engine, fetch_jobs))
+    fetch = {}
+    for engine, timed in runs.items():
+        timed.sort(key=lambda r: r["jobs_per_sec"])
+        traced = bench_fetch.run_engine(engine, fetch_jobs, trace_memory=True)
+        fetch[f"fetch {engine}"] = dict(
+            timed[len(timed) // 2],
+            jobs_per_sec_spread=bench_extract.spread([r["jobs_per_sec"] for r in timed]),
+            peak_bytes_per_job=traced["peak_bytes_per_job"],
+        )
+    report["results"].update(fetch)
+    report["params"].update({"fetch_jobs": fetch_jobs, "engines": engines})
+    report["meta"]["git_revision"] = revision()
+    return report
+
+
+def compare(current: dict, baseline: dict, threshold: float, mem_threshold: float) -> list[str]:
+    regressions = []
+    for case, metrics in current["results"].items():
+        base = baseline["results"].get(case)
+        if base is None:
+            continue
+        for metric, bigger_is_better in GATED.items():
+            new, old = metrics.get(metric), base.get(metric)
+            if not new or not old:
+                continue
+            change = (new - old) / old
+            # A drop within the spread the baseline itself showed between timing windows is noise, up to a point.
+            spread = min(base.get(f"{metric}_spread", 0.0), MAX_WIDENING * threshold)
+            limit = max(threshold, spread) if bigger_is_better else mem_threshold
+            worse = -change if bigger_is_better else change
+            flag = "REGRESSION" if worse > limit else ""
+            print(f"  {case:36s} {metric:22s} {old:>14,.1f} -> {new:>14,.1f}  {change:+7.1%}  {flag}")
+            if flag:
+                regressions.append(f"{case} {metric} {change:+.1%} (limit {limit:.0%})")
+    return regressions
+
+
+def noisy(report: dict, threshold: float) -> list[str]:
+    return [case for case, m in report["results"].items() if m.get("jobs_per_sec_spread", 0.0) > threshold]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=500, help="Jobs per extraction benchmark payload")
+    ap.add_argument("--fetch-jobs", type=int, default=1000, help="Jobs per end-to-end fake-server run")
+    ap.add_argument("--engine", nargs="*", choices=sorted(bench_fetch.ENGINES), default=["http"])
+    ap.add_argument("--baseline", default=str(BASELINE))
+    ap.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    ap.add_argument("--repeat", type=int, default=9, help="Timing windows per case; the median is gated")
+    ap.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per extraction timing window")
+    ap.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help=f"Allowed jobs/sec drop (fraction), widened to the baseline's own spread up to {MAX_WIDENING:g}x",
+    )
+    ap.add_argument("--mem-threshold", type=float, default=0.20, help="Allowed peak bytes/job growth (fraction)")
+    ap.add_argument(
+        "--baseline-attempts",
+        type=int,
+        default=3,
+        help="With --save-baseline, measure up to this many times until no case spreads wider than --threshold",
+    )
+    args = ap.parse_args()
+
+    report = run(args.jobs, args.fetch_jobs, args.engine, args.repeat, args.min_time)
+    for attempt in range(2, args.baseline_attempts + 1 if args.save_baseline else 0):
+        loud = noisy(report, args.threshold)
+        if not loud:
+            break
+        print(f"[WARN] Spread above {args.threshold:.0%} in {', '.join(loud)}; measuring again")
+        print(f"[INFO] Baseline attempt {attempt}/{args.baseline_attempts}")
+        report = run(args.jobs, args.fetch_jobs, args.engine, args.repeat, args.min_time)
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    out = RESULTS_DIR / f"{report['meta']['git_revision']}.json"
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"[OK] Wrote {out}")
+
+    if args.save_baseline:
+        loud = noisy(report, args.threshold)
+        if loud:
+            print(
+                f"[ERROR] Not saving a baseline: timing windows still spread more than {args.threshold:.0%} in "
+                f"{', '.join(loud)}. Use a quieter machine or a longer --min-time."
+            )
+            return 1
+        tmp = f"{args.baseline}.{os.getpid()}.tmp"
+        Path(tmp).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        os.replace(tmp, args.baseline)
+        print(f"[OK] Saved baseline {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"[WARN] No baseline at {args.baseline}; run with --save-baseline first.")
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    print(f"[INFO] Comparing {report['meta']['git_revision']} against {baseline['meta'].get('git_revision')}")
+    if baseline["params"] != report["params"]:
+        print("[WARN] Benchmark parameters differ from the baseline; comparing anyway.")
+    regressions = compare(report, baseline, args.threshold, args.mem_threshold)
+    if regressions:
+        print(f"[ERROR] {len(regressions)} performance regression(s):")
+        for r in regressions:
+            print(f"  - {r}")
+        return 1
+    print("[OK] No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Jobs/sec and allocations of the extraction functions on synthetic payloads, saved as JSON.
+
+    python benchmarks/bench_extract.py [--jobs 500] [--nesting 3] [--rounds 5] [--repeat 5] [--min-time 0.1]
+                                       [--out bench_extract.json]
+
+Each case gets `--repeat` timing windows of at least `--rounds` calls and `--min-time` seconds, interleaved with the
+other cases; the median window is reported as jobs/sec and `jobs_per_sec_spread` is (fastest - slowest) / median.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import jobright_scrape as js  # noqa: E402
+from benchmarks.payloads import make_payload  # noqa: E402
+
+
+def cases(payload: dict) -> list[tuple[str, Callable[[], Any]]]:
+    jobs = js._extract_job_dicts(payload)
+    shape = js._JobShape()
+    js._extract_job_dicts(payload, shape)
+
+    def each(fn: Callable[[dict], Any]) -> Callable[[], list]:
+        return lambda: [fn(j) for j in jobs]
+
+    return [
+        ("_extract_job_dicts", lambda: js._extract_job_dicts(payload)),
+        ("_extract_job_dicts (shape cached)", lambda: js._extract_job_dicts(payload, shape)),
+        ("extract_company", each(js.extract_company)),
+        ("extract_linkedin_recruiters", each(js.extract_linkedin_recruiters)),
+        ("extract_keywords", each(js.extract_keywords)),
+        ("_normalize_job (raw=none)", each(lambda j: js._normalize_job(j, js._job_id(j), raw_mode="none"))),
+    ]
+
+
+def spread(rates: list[float]) -> float:
+    return round((max(rates) - min(rates)) / statistics.median(rates), 3)
+
+
+def window(fn: Callable[[], Any], rounds: int, min_time: float) -> float:
+    # Seconds per call over at least `rounds` calls and `min_time` seconds.
+    calls = 0
+    t0 = time.perf_counter()
+    while True:
+        for _ in range(rounds):
+            fn()
+        calls += rounds
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            return elapsed / calls
+
+
+def memory(fn: Callable[[], Any], n_jobs: int) -> dict:
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        kept = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return {
+        "peak_bytes_per_job": round((peak - base) / n_jobs, 1),
+        "retained_bytes_per_job": round((current - base) / n_jobs, 1),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def run(n_jobs: int, nesting: int, rounds: int, repeat: int, seed: int = 0, min_time: float = 0.0) -> dict:
+    payload = make_payload(n_jobs, seed=seed, nesting=nesting)
+    named = cases(payload)
+    per_call: dict[str, list[float]] = {name: [] for name, _ in named}
+    # Windows are interleaved across cases, so machine drift during the run shows up in every case's spread.
+    for _ in range(repeat):
+        for name, fn in named:
+            per_call[name].append(window(fn, rounds, min_time))
+    results = {}
+    for name, fn in named:
+        rates = [n_jobs / t for t in per_call[name]]
+        results[name] = {
+            "jobs_per_sec": round(statistics.median(rates), 1),
+            "jobs_per_sec_spread": spread(rates),
+            "ns_per_job": round(statistics.median(per_call[name]) / n_jobs * 1e9, 1),
+            **memory(fn, n_jobs),
+        }
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": js._json_backend,
+        },
+        "params": {
+            "jobs": n_jobs,
+            "nesting": nesting,
+            "rounds": rounds,
+            "repeat": repeat,
+            "min_time": min_time,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=500)
+    ap.add_argument("--nesting", type=int, default=3)
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per timing window")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default="bench_extract.json")
+    args = ap.parse_args()
+
+    report = run(args.jobs, args.nesting, args.rounds, args.repeat, args.seed, args.min_time)
+
+    print(f"payload: {args.jobs} jobs, nesting {args.nesting}")
+    for name, r in report["results"].items():
+        print(
+            f"  {name:36s} {r['jobs_per_sec']:>12,.0f} jobs/sec  spread {r['jobs_per_sec_spread']:>4.0%}  "
+            f"{r['ns_per_job']:>9,.0f} ns/job  "
+            f"peak {r['peak_bytes_per_job']:>8,.0f} B/job  retained {r['retained_bytes_per_job']:>8,.0f} B/job"
+        )
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[OK] Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""End-to-end fetch throughput against the local fake server (no jobright.ai traffic), saved as JSON.
+
+    python benchmarks/bench_fetch.py [--jobs 2000] [--page-size 50] [--latency-ms 40] [--engine http async browser]
+
+The browser engine needs Chromium (`python -m playwright install chromium`).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import jobright_scrape as js  # noqa: E402
+from benchmarks.fake_server import VARIANTS, FakeJobright, fixed, lognormal  # noqa: E402
+
+ENGINES = {
+    "http": lambda n, size, opts: js.fetch_recommendations_via_http(
+        n, page_size=size, pipeline_depth=opts["pipeline"]
+    ),
+    "async": lambda n, size, opts: js.fetch_recommendations_async(n, page_size=size, concurrency=opts["concurrency"]),
+    "browser": lambda n, size, opts: js.fetch_recommendations_via_api(
+        n, page_size=size, pipeline_depth=opts["pipeline"]
+    ),
+}
+
+
+def run_engine(
+    engine: str,
+    n_jobs: int,
+    page_size: int = 50,
+    latency: float = 0.0,
+    sigma: float = 0.0,
+    variant: str = "realistic",
+    concurrency: int = 4,
+    pipeline: int = 0,
+    trace_memory: bool = False,
+) -> dict:
+    saved = js.STATE_FILE, js.BASE, js.RECS_PAGE, js.RECS_API
+    srv = FakeJobright(
+        total=n_jobs,
+        variant=variant,
+        latency=lognormal(latency, sigma) if sigma and latency else fixed(latency),
+    )
+    try:
+        with tempfile.TemporaryDirectory() as tmp, srv:
+            js.STATE_FILE = str(Path(tmp) / "jobright_state.json")
+            Path(js.STATE_FILE).write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
+            js.BASE, js.RECS_PAGE, js.RECS_API = srv.base_url, f"{srv.base_url}/jobs/recommend", srv.api_url
+            if trace_memory:
+                tracemalloc.start()
+            try:
+                t0 = time.perf_counter()
+                jobs = ENGINES[engine](n_jobs, page_size, {"concurrency": concurrency, "pipeline": pipeline})
+                wall = time.perf_counter() - t0
+                peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+            finally:
+                if trace_memory:
+                    tracemalloc.stop()
+    finally:
+        js.STATE_FILE, js.BASE, js.RECS_PAGE, js.RECS_API = saved
+
+    result = {
+        "jobs": len(jobs),
+        "wall_s": round(wall, 3),
+        "jobs_per_sec": round(len(jobs) / wall, 1),
+        "requests": srv.api_calls,
+        "mb_received": round(srv.bytes_served / 1e6, 2),
+    }
+    if peak is not None:
+        result["peak_bytes_per_job"] = round(peak / max(len(jobs), 1), 1)
+    return result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=2000)
+    ap.add_argument("--page-size", type=int, default=50)
+    ap.add_argument("--latency-ms", type=float, default=40.0, help="Median API latency")
+    ap.add_argument("--sigma", type=float, default=0.5, help="Log-normal spread of latency (0 for fixed)")
+    ap.add_argument("--variant", choices=VARIANTS, default="realistic")
+    ap.add_argument("--engine", nargs="+", choices=sorted(ENGINES), default=["http", "async"])
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--pipeline", type=int, default=0)
+    ap.add_argument("--out", default="bench_fetch.json")
+    args = ap.parse_args()
+
+    results = {}
+    for engine in args.engine:
+        r = results[engine] = run_engine(
+            engine,
+            args.jobs,
+            args.page_size,
+            args.latency_ms / 1000,
+            args.sigma,
+            args.variant,
+            args.concurrency,
+            args.pipeline,
+        )
+        print(
+            f"  {engine:8s} {r['jobs']:>6} jobs in {r['wall_s']:>7.2f} s  {r['jobs_per_sec']:>9,.0f} jobs/sec  "
+            f"{r['requests']} requests  {r['mb_received']} MB"
+        )
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"params": vars(args), "results": results}, f, indent=2)
+    print(f"[OK] Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Time per payload and visited nodes/sec of the payload walker in _extract_job_dicts vs the old recursive one.
+
+    python benchmarks/bench_walk.py [--jobs 200] [--nesting 3] [--rounds 20]
+
+The payload comes from benchmarks/payloads.make_payload, like bench_extract's.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import jobright_scrape as js  # noqa: E402
+from benchmarks.payloads import make_payload  # noqa: E402
+
+
+def recursive_walk(obj: Any) -> list[dict]:
+    # The pre-rewrite walker and its per-call is_job, kept verbatim as the baseline (no _is_job cache).
+    PROFILE_KEYS = {"firstName", "fullName", "linkedinUrl"}
+    ID_KEYS = {"jobInfoId", "jobId", "job_id", "jobID", "id"}
+    TITLE_KEYS = {"jobTitle", "title", "positionTitle", "name"}
+    COMPANY_KEYS = {"companyName", "company", "company_name"}
+    APPLY_KEYS = {"applyUrl", "applyURL", "applyLink", "externalUrl", "sourceUrl", "url", "originalUrl"}
+
+    jobs: list[dict] = []
+
+    def is_job(d: dict) -> bool:
+        keys = set(d.keys())
+
+        if keys & PROFILE_KEYS:
+            return False
+
+        has_id = bool(keys & ID_KEYS)
+        has_title = bool(keys & TITLE_KEYS)
+        has_company = bool(keys & COMPANY_KEYS)
+        has_apply = bool(keys & APPLY_KEYS)
+
+        return has_id and has_title and (has_company or has_apply)
+
+    def walk(x: Any) -> None:
+        if isinstance(x, dict):
+            if is_job(x):
+                jobs.append(x)
+            for v in x.values():
+                walk(v)
+        elif isinstance(x, list):
+            for i in x:
+                walk(i)
+
+    walk(obj)
+    return jobs
+
+
+def deep_payload(depth: int) -> dict:
+    root: dict = {}
+    node = root
+    for _ in range(depth):
+        node["next"] = {}
+        node = node["next"]
+    node["jobs"] = [{"jobInfoId": 1, "jobTitle": "SWE", "companyName": "Acme"}]
+    return root
+
+
+def count_containers(obj: Any) -> int:
+    n = 0
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        n += 1
+        if isinstance(x, dict):
+            stack.extend(v for v in x.values() if isinstance(v, (dict, list)))
+        elif isinstance(x, list):
+            stack.extend(v for v in x if isinstance(v, (dict, list)))
+    return n
+
+
+def measure(fn: Any, payload: Any, rounds: int, visited: int | None = None) -> tuple[float, float]:
+    # Returns (ms per payload, visited nodes/sec). Nodes are the containers the walker actually entered,
+    # so a pruning walker is not credited for subtrees it skipped.
+    if visited is None:
+        before = js.WALK_STATS["nodes"]
+        fn(payload)
+        visited = js.WALK_STATS["nodes"] - before
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn(payload)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, visited / best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=200)
+    ap.add_argument("--nesting", type=int, default=3)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+
+    payload = make_payload(args.jobs, nesting=args.nesting)
+    assert recursive_walk(payload) == js._extract_job_dicts(payload, prune=frozenset())
+
+    total = count_containers(payload)
+    print(f"payload: {args.jobs} jobs, nesting {args.nesting}, {total} container nodes")
+    cases = [
+        ("recursive (before)", recursive_walk, total),
+        ("iterative, no pruning", lambda p: js._extract_job_dicts(p, prune=frozenset()), None),
+        ("iterative, default pruning", js._extract_job_dicts, None),
+    ]
+    for name, fn, visited in cases:
+        ms, nps = measure(fn, payload, args.rounds, visited)
+        print(f"  {name:28s} {ms:>8.2f} ms/payload  {nps:>12,.0f} visited nodes/sec")
+
+    deep = deep_payload(sys.getrecursionlimit() + 100)
+    try:
+        recursive_walk(deep)
+        print("deep payload: recursive walk ok")
+    except RecursionError:
+        print("deep payload: recursive walk hit RecursionError")
+    found = js._extract_job_dicts(deep, max_depth=sys.getrecursionlimit() + 200)
+    print(f"deep payload: iterative walk found {len(found)} job(s)")
+
+
+if __name__ == "__main__":
+    main()
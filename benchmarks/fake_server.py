@@ -0,0 +1,257 @@
+"""A configurable local stand-in for jobright.ai, for tests, load tests and fault injection.
+
+    srv = FakeJobright(total=5000, latency=lognormal(0.05, 0.5), errors={429: 0.01}, unauthorized_every=200)
+    srv.start()
+    monkeypatch.setattr(js, "RECS_API", srv.api_url)  # plus BASE / RECS_PAGE, see srv.patch()
+    ...
+    srv.stop()
+"""
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.payloads import make_job, profile_decoy
+
+Latency = Callable[[random.Random], float]
+
+VARIANTS = ("minimal", "classic", "realistic")
+ENVELOPES = ("data.jobs", "data", "result.jobList", "nested")
+
+
+def fixed(seconds: float) -> Latency:
+    return lambda rng: seconds
+
+
+def uniform(lo: float, hi: float) -> Latency:
+    return lambda rng: rng.uniform(lo, hi)
+
+
+def lognormal(median: float, sigma: float) -> Latency:
+    # Long right tail, like real API latency; `median` is in seconds.
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+def _minimal_job(n: int) -> dict:
+    return {"jobInfoId": f"job-{n}", "jobTitle": "Software Engineer", "companyName": "Acme", "applyUrl": f"/apply/{n}"}
+
+
+def _classic_job(n: int) -> dict:
+    return {
+        "jobInfoId": f"job-{n}",
+        "jobTitle": "Software Engineer",
+        "companyName": "Acme",
+        "jobLocation": "Remote",
+        "applyUrl": "/apply/123",
+        "detailUrl": f"/jobs/info/job-{n}",
+        "socialConnections": [
+            {
+                "fullName": "Jane Recruiter",
+                "jobTitle": "Technical Recruiter",
+                "companyName": "Acme",
+                "linkedinUrl": "https://linkedin.com/in/jane",
+            },
+            {
+                "fullName": "Bob Engineer",
+                "jobTitle": "Software Engineer",
+                "companyName": "Acme",
+                "linkedinUrl": "https://linkedin.com/in/bob",
+            },
+        ],
+        "jdCoreSkills": [{"skill": "Python"}, {"skill": "SQL"}],
+        "recommendationTags": ["New Grad", "Remote"],
+    }
+
+
+class FakeJobright:
+    def __init__(
+        self,
+        total: int | None = None,
+        variant: str = "classic",
+        envelope: str = "data.jobs",
+        latency: float | Latency = 0.0,
+        status: int = 200,
+        errors: dict[int, float] | None = None,
+        script: dict[int, int] | None = None,
+        unauthorized_every: int = 0,
+        padding: int = 0,
+        overlap: int = 0,
+        rotate_session: bool = False,
+        daemon_state: str | None = None,
+        seed: int = 0,
+    ):
+        if variant not in VARIANTS:
+            raise ValueError(f"variant must be one of {VARIANTS}")
+        if envelope not in ENVELOPES:
+            raise ValueError(f"envelope must be one of {ENVELOPES}")
+        self.total = total
+        self.variant = variant
+        self.envelope = envelope
+        self.latency = fixed(latency) if isinstance(latency, (int, float)) else latency
+        self.status = status
+        self.errors = errors or {}
+        self.script = script or {}
+        self.unauthorized_every = unauthorized_every
+        self.padding = padding
+        self.overlap = overlap
+        self.rotate_session = rotate_session
+        self.daemon_state = daemon_state
+        self.seed = seed
+
+        self.lock = threading.Lock()
+        self.rng = random.Random(seed)
+        self.api_calls = 0
+        self.statuses: Counter[int] = Counter()
+        self.cookies: list[str | None] = []
+        self.ports: set[int] = set()
+        self.proxied = False
+        self.authorizations: list[str | None] = []
+        self.jobs_served = 0
+        self.bytes_served = 0
+        self.httpd: ThreadingHTTPServer | None = None
+        self.base_url = ""
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/swan/recommend/list/jobs"
+
+    def patch(self, monkeypatch: Any, js: Any) -> None:
+        monkeypatch.setattr(js, "BASE", self.base_url)
+        monkeypatch.setattr(js, "RECS_PAGE", f"{self.base_url}/jobs/recommend")
+        monkeypatch.setattr(js, "RECS_API", self.api_url)
+
+    def job(self, n: int) -> dict:
+        if self.variant == "minimal":
+            job = _minimal_job(n)
+        elif self.variant == "classic":
+            job = _classic_job(n)
+        else:
+            job = make_job(n, random.Random(self.seed * 1_000_003 + n))
+        if self.padding:
+            job["jobDescription"] = "x" * self.padding
+        return job
+
+    def page(self, position: int, count: int) -> list[dict]:
+        # `overlap` repeats the tail of the previous page, as the real feed sometimes does.
+        first = max(position - self.overlap, 0)
+        last = first + count if self.total is None else min(first + count, self.total)
+        return [self.job(n) for n in range(first, last)]
+
+    def payload(self, position: int, count: int) -> dict:
+        return self.wrap(self.page(position, count), position)
+
+    def wrap(self, jobs: list[dict], position: int) -> dict:
+        if self.envelope == "data.jobs":
+            return {"data": {"jobs": jobs}}
+        if self.envelope == "data":
+            return {"data": jobs}
+        if self.envelope == "result.jobList":
+            return {"success": True, "result": {"jobList": jobs, "total": self.total}}
+        return {
+            "success": True,
+            "result": {"page": {"position": position}, "level0": {"level1": {"jobList": jobs}}},
+            "profile": {"firstName": "Me", "fullName": "Me Me", "linkedinUrl": "https://www.linkedin.com/in/me"},
+            "recommendedPeople": [profile_decoy(i) for i in range(3)],
+        }
+
+    def _api_status(self) -> tuple[int, float, int]:
+        # Returns (status, delay, call number); the number is taken under the lock, so it is unique per call.
+        with self.lock:
+            self.api_calls += 1
+            n = self.api_calls
+            delay = max(0.0, self.latency(self.rng))
+            roll = self.rng.random()
+        if n in self.script:
+            return self.script[n], delay, n
+        if self.unauthorized_every and n % self.unauthorized_every == 0:
+            return 401, delay, n
+        for code, rate in self.errors.items():
+            if roll < rate:
+                return code, delay, n
+            roll -= rate
+        return self.status, delay, n
+
+    def start(self) -> FakeJobright:
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, fmt: str, *args: Any) -> None:
+                return
+
+            def _send(self, code: int, body: bytes, content_type: str = "application/json", **headers: str) -> None:
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in headers.items():
+                    self.send_header(k.replace("_", "-"), v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                if parsed.path == "/health":
+                    # As the warm-browser daemon answers, when standing in for one.
+                    return self._send(200, json.dumps({"ok": True, "state_file": srv.daemon_state}).encode("utf-8"))
+                if parsed.path == "/jobs/recommend":
+                    return self._send(200, b"<html><body>recommendations</body></html>", "text/html; charset=utf-8")
+                if parsed.path == "/get":
+                    # Lets the fake stand in for the warm-browser daemon too.
+                    srv.proxied = True
+                    srv.authorizations.append(self.headers.get("authorization"))
+                    parsed = urlparse(parse_qs(parsed.query)["url"][0])
+                if parsed.path != "/swan/recommend/list/jobs":
+                    return self._send(404, b"not found", "text/plain; charset=utf-8")
+
+                code, delay, n = srv._api_status()
+                with srv.lock:
+                    srv.cookies.append(self.headers.get("cookie"))
+                    srv.ports.add(self.client_address[1])
+                    srv.statuses[code] += 1
+                if delay:
+                    time.sleep(delay)
+
+                if code == 429:
+                    return self._send(429, b'{"error":"rate limited"}', Retry_After="1")
+                if code != 200:
+                    return self._send(code, json.dumps({"error": f"HTTP {code}"}).encode("utf-8"))
+
+                qs = parse_qs(parsed.query)
+                position = int(qs.get("position", ["0"])[0])
+                count = int(qs.get("count", ["10"])[0])
+                jobs = srv.page(position, count)
+                body = json.dumps(srv.wrap(jobs, position)).encode("utf-8")
+                with srv.lock:
+                    srv.jobs_served += len(jobs)
+                    srv.bytes_served += len(body)
+                if srv.rotate_session:
+                    # A fresh session cookie on every response, like a server that rotates sessions.
+                    cookie = f"sid=rot-{n}; Path=/; HttpOnly; SameSite=Lax; Max-Age=3600"
+                    return self._send(200, body, "application/json; charset=utf-8", Set_Cookie=cookie)
+                return self._send(200, body, "application/json; charset=utf-8")
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def __enter__(self) -> FakeJobright:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
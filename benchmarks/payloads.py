@@ -0,0 +1,105 @@
+"""Synthetic recommendation payloads shaped like the real API, for benchmarks and load tests.
+
+    from benchmarks.payloads import make_payload
+    payload = make_payload(1000, nesting=3, seed=1)
+"""
+from __future__ import annotations
+
+import random
+from typing import Any
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Soylent"]
+TITLES = ["Software Engineer", "Backend Engineer", "Data Scientist", "ML Engineer", "SRE", "Frontend Engineer"]
+PEOPLE_TITLES = ["Technical Recruiter", "Talent Acquisition Partner", "Sourcer", "HR Business Partner",
+                 "Software Engineer", "Engineering Manager", "Product Manager", "Staff Engineer"]
+SKILLS = ["Python", "SQL", "AWS", "Kubernetes", "Go", "React", "Spark", "Terraform", "Java", "Rust", "Kafka", "GCP"]
+TAGS = ["New Grad", "Remote", "H1B Sponsor", "Hybrid", "Early Career", "Top Company"]
+TAXONOMY = ["Software", "Backend", "Data", "Infrastructure", "Machine Learning", "Web"]
+
+# How each job names its company; the extractor has a fallback path for every one of these.
+COMPANY_STYLES = ("companyName", "company_dict", "companyInfo", "jdCompanyName", "summary", "logo")
+
+
+def _company(job: dict, name: str, style: str) -> None:
+    if style == "companyName":
+        job["companyName"] = name
+    elif style == "company_dict":
+        job["company"] = {"name": name, "id": COMPANIES.index(name), "size": "1001-5000"}
+    elif style == "companyInfo":
+        job["companyInfo"] = {"displayName": name, "industry": "Technology"}
+    elif style == "jdCompanyName":
+        job["jdCompanyName"] = name
+    elif style == "summary":
+        job["jobSummary"] = f"{name} is hiring engineers to build reliable systems at scale."
+    else:
+        job["jdLogo"] = f"https://cdn.example.com/logos/{name.lower().replace(' ', '')}_logo.png"
+
+
+def make_job(i: int, rng: random.Random, connections: int = 8, skills: int = 12, scores: int = 10) -> dict:
+    name = rng.choice(COMPANIES)
+    job: dict[str, Any] = {
+        "jobInfoId": f"job-{i}",
+        "jobTitle": rng.choice(TITLES),
+        "jobLocation": rng.choice(["Remote", "New York, NY", "Seattle, WA", {"name": "Austin, TX"}]),
+        "applyUrl": f"/apply/{i}",
+        "publishTime": 1_700_000_000 + i,
+        "socialConnections": [
+            {
+                "fullName": f"Person {i}-{n}",
+                "jobTitle": rng.choice(PEOPLE_TITLES),
+                "companyName": name,
+                "linkedinUrl": f"https://www.linkedin.com/in/p{i}-{n}",
+                "education": [{"school": "State U", "degrees": [{"name": "BS", "years": [2015, 2019]}]}],
+            }
+            for n in range(connections)
+        ],
+        "jdCoreSkills": [
+            {"skill": rng.choice(SKILLS), "evidence": {"spans": [[n, n + 4]], "source": "jd"}} for n in range(skills)
+        ],
+        "skillMatchingScores": [
+            {"featureName": rng.choice(SKILLS), "displayName": None if n % 2 else rng.choice(SKILLS),
+             "score": round(rng.random(), 3), "detail": {"weight": n}}
+            for n in range(scores)
+        ],
+        "jobTaxonomyV3": rng.sample(TAXONOMY, 2),
+        "firstTaxonomy": rng.choice(TAXONOMY),
+        "recommendationTags": rng.sample(TAGS, 2),
+        "jobTags": rng.sample(TAGS, 1),
+    }
+    _company(job, name, COMPANY_STYLES[i % len(COMPANY_STYLES)])
+    return job
+
+
+def profile_decoy(i: int) -> dict:
+    # Looks like a job to a naive walker: has a title and a company, but is a person.
+    return {
+        "firstName": f"Decoy{i}",
+        "fullName": f"Decoy {i}",
+        "jobTitle": "Recruiter",
+        "companyName": "Acme",
+        "linkedinUrl": f"https://www.linkedin.com/in/decoy{i}",
+    }
+
+
+def make_payload(
+    n_jobs: int,
+    seed: int = 0,
+    nesting: int = 1,
+    connections: int = 8,
+    skills: int = 12,
+    scores: int = 10,
+    decoys: int = 3,
+    start: int = 0,
+) -> dict:
+    rng = random.Random(seed)
+    jobs: list[Any] = [make_job(start + i, rng, connections, skills, scores) for i in range(n_jobs)]
+    result: dict[str, Any] = {"jobList": jobs, "total": n_jobs, "hasMore": True}
+    for depth in range(nesting - 1):
+        result = {"page": {"position": start, "count": n_jobs}, f"level{depth}": result}
+    return {
+        "success": True,
+        "errorCode": None,
+        "result": result,
+        "profile": {"firstName": "Me", "fullName": "Me Me", "linkedinUrl": "https://www.linkedin.com/in/me"},
+        "recommendedPeople": [profile_decoy(i) for i in range(decoys)],
+    }
@@ -1,17 +1,444 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import bisect
+import codecs
+import contextlib
+import email.utils
+import hashlib
+import hmac
+import http.client
 import json
+import math
+import os
+import queue
 import re
-from typing import Any
-from urllib.parse import urlencode, urljoin, urlparse
+import secrets
+import sqlite3
+import struct
+import threading
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone
+from http.cookies import CookieError, SimpleCookie
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Sequence
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 STATE_FILE = "jobright_state.json"
 BASE = "https://jobright.ai"
 RECS_PAGE = f"{BASE}/jobs/recommend"
 RECS_API = f"{BASE}/swan/recommend/list/jobs"
+DAEMON_PORT = 8765
+PROFILE_FILE = "jobright_profile.json"
+MEMPROFILE_FILE = "jobright_memprofile.json"
+
+JSON_BACKENDS = ("auto", "stdlib", "orjson")
+_json_backend = "orjson" if orjson is not None else "stdlib"
+JSON_STATS = {"decode_calls": 0, "decode_s": 0.0, "decode_bytes": 0, "encode_calls": 0, "encode_s": 0.0}
+
+
+def set_json_backend(name: str) -> str:
+    global _json_backend
+    if name == "orjson" and orjson is None:
+        raise ImportError("orjson is not installed (pip install orjson)")
+    _json_backend = ("orjson" if orjson is not None else "stdlib") if name == "auto" else name
+    return _json_backend
+
+
+def _json_loads(data: bytes | str) -> Any:
+    t0 = time.perf_counter()
+    try:
+        if _json_backend == "orjson":
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects a few things the stdlib accepts (NaN, >64-bit ints); let the stdlib decide.
+                pass
+        return json.loads(data)
+    finally:
+        JSON_STATS["decode_calls"] += 1
+        JSON_STATS["decode_s"] += time.perf_counter() - t0
+        JSON_STATS["decode_bytes"] += len(data)
+
+
+def _json_dumps(obj: Any, compact: bool = False) -> str:
+    # Only compact output goes through the fast backend; the default formatting is always the stdlib's.
+    t0 = time.perf_counter()
+    try:
+        if not compact:
+            return json.dumps(obj)
+        if _json_backend == "orjson":
+            try:
+                return orjson.dumps(obj).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    finally:
+        JSON_STATS["encode_calls"] += 1
+        JSON_STATS["encode_s"] += time.perf_counter() - t0
+
+
+def _json_write(path: str, obj: Any, compact: bool = False) -> None:
+    t0 = time.perf_counter()
+    blob = None
+    if compact and _json_backend == "orjson":
+        try:
+            blob = orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    if blob is not None:
+        with open(path, "wb") as fb:
+            fb.write(blob)
+    elif compact:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, separators=(",", ":"), ensure_ascii=False)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2)
+    JSON_STATS["encode_calls"] += 1
+    JSON_STATS["encode_s"] += time.perf_counter() - t0
+
+
+class _Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.samples: dict[str, list[float]] = {}
+        self.started = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.samples.clear()
+        self.started = time.perf_counter()
+
+    def record(self, name: str, seconds: float) -> None:
+        self.samples.setdefault(name, []).append(seconds)
+
+    def report(self) -> dict:
+        spans = {}
+        for name, xs in self.samples.items():
+            xs = sorted(xs)
+            spans[name] = {
+                "count": len(xs),
+                "total_ms": round(sum(xs) * 1000, 3),
+                "p50_ms": round(_percentile(xs, 50) * 1000, 3),
+                "p95_ms": round(_percentile(xs, 95) * 1000, 3),
+                "max_ms": round(xs[-1] * 1000, 3),
+            }
+        return {"wall_ms": round((time.perf_counter() - self.started) * 1000, 3), "spans": spans}
+
+
+def _percentile(sorted_xs: list[float], pct: float) -> float:
+    if not sorted_xs:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_xs)))
+    return sorted_xs[rank - 1]
+
+
+PROFILER = _Profiler()
+
+
+class _Tracer:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.events: list[dict] = []
+        self.threads: dict[int, str] = {}
+        self.started = time.perf_counter()
+        self._last_id = 0
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.events.clear()
+        self.threads.clear()
+        self.started = time.perf_counter()
+
+    def _us(self, t: float) -> float:
+        return round((t - self.started) * 1e6, 1)
+
+    def record(self, name: str, t0: float, t1: float, overlap: bool = False) -> None:
+        thread = threading.current_thread()
+        self.threads.setdefault(thread.ident, thread.name)
+        event = {"name": name, "cat": name.split(".", 1)[0], "pid": os.getpid(), "tid": thread.ident}
+        if overlap:
+            # Concurrent spans on one thread (async requests) would break X-event nesting; use async b/e pairs.
+            self._last_id += 1
+            self.events.append(dict(event, ph="b", id=self._last_id, ts=self._us(t0)))
+            self.events.append(dict(event, ph="e", id=self._last_id, ts=self._us(t1)))
+        else:
+            self.events.append(dict(event, ph="X", ts=self._us(t0), dur=round((t1 - t0) * 1e6, 1)))
+
+    def trace(self) -> dict:
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in self.threads.items()
+        ]
+        return {"traceEvents": meta + sorted(self.events, key=lambda e: e["ts"]), "displayTimeUnit": "ms"}
+
+
+TRACER = _Tracer()
+TRACE_SKIP = frozenset({"extract.fields", "normalize.job"})
+
+
+class _Span:
+    __slots__ = ("name", "t0", "overlap")
+
+    def __init__(self, name: str, overlap: bool = False):
+        self.name = name
+        self.overlap = overlap
+
+    def __enter__(self) -> _Span:
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        t1 = time.perf_counter()
+        seconds = t1 - self.t0
+        if PROFILER.enabled:
+            PROFILER.record(self.name, seconds)
+        if METRICS.enabled and self.name in METRIC_PHASES:
+            METRICS.observe("jobright_phase_duration_seconds", seconds, phase=self.name)
+        if TRACER.enabled and self.name not in TRACE_SKIP:
+            TRACER.record(self.name, self.t0, t1, self.overlap)
+
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def _span(name: str, overlap: bool = False) -> contextlib.AbstractContextManager:
+    if PROFILER.enabled or TRACER.enabled or (METRICS.enabled and name in METRIC_PHASES):
+        return _Span(name, overlap)
+    return _NO_SPAN
+
+
+METRIC_DEFS = {
+    "jobright_pages_fetched_total": ("counter", "Recommendation API pages fetched with HTTP 200."),
+    "jobright_jobs_emitted_total": ("counter", "Jobs handed to the output sinks."),
+    "jobright_duplicates_skipped_total": ("counter", "Jobs skipped as duplicates of this run or of the seen store."),
+    "jobright_http_responses_total": ("counter", "Recommendation API responses by HTTP status code."),
+    "jobright_response_bytes_total": ("counter", "Recommendation API response bytes received."),
+    "jobright_auth_retries_total": ("counter", "Page reloads after a 401/403 from the API."),
+    "jobright_engine_fallbacks_total": ("counter", "Runs that fell back to the browser engine after a 401/403."),
+    "jobright_phase_duration_seconds": ("histogram", "Latency of fetch pipeline phases."),
+    "jobright_run_duration_seconds": ("gauge", "Wall time of the last run."),
+    "jobright_run_success": ("gauge", "1 if the last run fetched jobs without an error, else 0."),
+    "jobright_run_timestamp_seconds": ("gauge", "Unix time at which the last run finished."),
+}
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PHASES = frozenset(
+    {"api.request", "json.decode", "extract.jobs", "extract.batch", "sink.write", "page.goto", "page.ready_wait"}
+)
+METRICS_FILE = "jobright.prom"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Metrics:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.values: dict[str, dict[tuple[tuple[str, str], ...], Any]] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.values.clear()
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self.lock:
+            series = self.values.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self.lock:
+            self.values.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self.lock:
+            series = self.values.setdefault(name, {})
+            h = series.get(key)
+            if h is None:
+                # Per-bucket counts, then +Inf, then the sum.
+                h = series[key] = [0] * (len(METRIC_BUCKETS) + 1) + [0.0]
+            h[bisect.bisect_left(METRIC_BUCKETS, seconds)] += 1
+            h[-1] += seconds
+
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for name, (kind, help_text) in METRIC_DEFS.items():
+                series = self.values.get(name)
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for key, value in sorted(series.items()):
+                    if kind != "histogram":
+                        lines.append(f"{name}{_metric_labels(key)} {_metric_value(value)}")
+                        continue
+                    total = 0
+                    for le, n in zip([*map(_metric_value, METRIC_BUCKETS), "+Inf"], value[:-1]):
+                        total += n
+                        lines.append(f"{name}_bucket{_metric_labels(key + (('le', le),))} {total}")
+                    lines.append(f"{name}_sum{_metric_labels(key)} {_metric_value(value[-1])}")
+                    lines.append(f"{name}_count{_metric_labels(key)} {total}")
+        return "\n".join(lines) + "\n"
+
+
+def _metric_labels(key: tuple[tuple[str, str], ...]) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{k}="{_metric_escape(v)}"' for k, v in key) + "}"
+
+
+def _metric_escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+METRICS = _Metrics()
+
+
+def _write_metrics(path: str) -> None:
+    # Textfile collectors may read at any moment, so never leave a half-written file behind.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(METRICS.render())
+    os.replace(tmp, path)
+    print(f"[OK] Wrote metrics {path}")
+
+
+def _write_profile(path: str) -> dict:
+    report = PROFILER.report()
+    _json_write(path, report)
+    print(f"[OK] Wrote profile {path} (wall {report['wall_ms']:.0f} ms)")
+    for name, s in sorted(report["spans"].items(), key=lambda kv: -kv[1]["total_ms"]):
+        print(
+            f"  {name:<18} n={s['count']:<6} total={s['total_ms']:>9.1f} ms  "
+            f"p50={s['p50_ms']:.2f}  p95={s['p95_ms']:.2f}  max={s['max_ms']:.2f}"
+        )
+    return report
+
+
+class _MemProfiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.top = 15
+        self.every = 0
+        self.pages: dict[str, int] = {}
+        self.stages: list[dict] = []
+        self.snapshots: list[tuple[str, tracemalloc.Snapshot]] = []
+
+    def enable(self, top: int = 15, every: int = 0) -> None:
+        self.enabled = True
+        self.top = top
+        self.every = every
+        self.pages.clear()
+        self.stages.clear()
+        self.snapshots.clear()
+        tracemalloc.start()
+
+    def mark(self, stage: str, **info: Any) -> None:
+        # Cheap enough for every page: only the traced totals, no snapshot.
+        if not self.enabled:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.stages.append({"stage": stage, **info, "current_bytes": current, "peak_bytes": peak})
+
+    def snapshot(self, stage: str, **info: Any) -> None:
+        if not self.enabled:
+            return
+        self.mark(stage, **info)
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib.*"))
+        self.snapshots.append((stage, tracemalloc.take_snapshot().filter_traces(ignore)))
+
+    def page(self, stage: str, **info: Any) -> None:
+        # Full snapshots on the first page and every Nth one after it (--memprofile-every), totals otherwise.
+        if not self.enabled:
+            return
+        n = self.pages[stage] = self.pages.get(stage, 0) + 1
+        if n == 1 or (self.every and n % self.every == 0):
+            self.snapshot(f"{stage}#{n}", page=n, **info)
+        else:
+            self.mark(stage, page=n, **info)
+
+    def _stage_bytes(self, stage: str) -> int | None:
+        for s in reversed(self.stages):
+            if s["stage"] == stage:
+                return s["current_bytes"]
+        return None
+
+    def report(self, retained_jobs: int) -> dict:
+        transitions = []
+        for (before, old), (after, new) in zip(self.snapshots, self.snapshots[1:]):
+            diff = new.compare_to(old, "lineno")
+            transitions.append(
+                {
+                    "from": before,
+                    "to": after,
+                    "net_bytes": sum(d.size_diff for d in diff),
+                    "top_sites": [
+                        {
+                            "site": f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+                            "size_diff": d.size_diff,
+                            "count_diff": d.count_diff,
+                            "size": d.size,
+                        }
+                        for d in diff[: self.top]
+                    ],
+                }
+            )
+        start = self._stage_bytes("start")
+        held = self._stage_bytes("dump.before") or self._stage_bytes("fetch.done")
+        per_job = None
+        if start is not None and held is not None and retained_jobs:
+            per_job = round((held - start) / retained_jobs, 1)
+        return {
+            "peak_bytes": max((s["peak_bytes"] for s in self.stages), default=0),
+            "retained_jobs": retained_jobs,
+            "bytes_per_retained_job": per_job,
+            "stages": self.stages,
+            "transitions": transitions,
+        }
+
+
+MEMPROF = _MemProfiler()
+
+
+def _write_memprofile(path: str, retained_jobs: int) -> dict:
+    report = MEMPROF.report(retained_jobs)
+    tracemalloc.stop()
+    MEMPROF.enabled = False
+    _json_write(path, report)
+    per_job = report["bytes_per_retained_job"]
+    print(
+        f"[OK] Wrote memory profile {path} (peak {report['peak_bytes'] / 1e6:.1f} MB traced, "
+        f"{f'{per_job / 1024:.1f} KB' if per_job is not None else 'n/a'} per retained job)"
+    )
+    for t in report["transitions"]:
+        print(f"  {t['from']} -> {t['to']}: {t['net_bytes'] / 1e6:+.2f} MB")
+        for site in t["top_sites"][:5]:
+            print(f"    {site['size_diff'] / 1024:>+10.1f} KB  {site['count_diff']:>+8} blocks  {site['site']}")
+    return report
 
 
 def save_login_state() -> None:
@@ -25,12 +452,7 @@ def save_login_state() -> None:
         page.goto(BASE, wait_until="domcontentloaded")
         input("Log in in the opened browser, then press ENTER here...")
 
-        try:
-            page.goto(RECS_PAGE, wait_until="domcontentloaded", timeout=120_000)
-        except PWTimeoutError:
-            pass
-
-        page.wait_for_timeout(2000)
+        _open_recs_page(page, 2000, "login", nav_timeout_ms=120_000)
         input("Wait until you SEE recommendations, then press ENTER here...")
 
         context.storage_state(path=STATE_FILE)
@@ -45,40 +467,264 @@ def _pick(d: dict, *keys: str) -> Any:
     return None
 
 
-def _extract_job_dicts(obj: Any) -> list[dict]:
-    PROFILE_KEYS = {"firstName", "fullName", "linkedinUrl"}
-    ID_KEYS = {"jobInfoId", "jobId", "job_id", "jobID", "id"}
-    TITLE_KEYS = {"jobTitle", "title", "positionTitle", "name"}
-    COMPANY_KEYS = {"companyName", "company", "company_name"}
-    APPLY_KEYS = {"applyUrl", "applyURL", "applyLink", "externalUrl", "sourceUrl", "url", "originalUrl"}
+_PROFILE_KEYS = frozenset({"firstName", "fullName", "linkedinUrl"})
+_ID_KEYS = frozenset({"jobInfoId", "jobId", "job_id", "jobID", "id"})
+_TITLE_KEYS = frozenset({"jobTitle", "title", "positionTitle", "name"})
+_COMPANY_KEYS = frozenset({"companyName", "company", "company_name"})
+_APPLY_KEYS = frozenset({"applyUrl", "applyURL", "applyLink", "externalUrl", "sourceUrl", "url", "originalUrl"})
+
+_IS_JOB_CACHE: dict[frozenset, bool] = {}
+_IS_JOB_CACHE_MAX = 4096
+
+
+def _is_job(d: dict) -> bool:
+    keys = frozenset(d)
+    hit = _IS_JOB_CACHE.get(keys)
+    if hit is not None:
+        return hit
+
+    if keys & _PROFILE_KEYS:
+        result = False
+    else:
+        has_id = bool(keys & _ID_KEYS)
+        has_title = bool(keys & _TITLE_KEYS)
+        has_company = bool(keys & _COMPANY_KEYS)
+        has_apply = bool(keys & _APPLY_KEYS)
+        result = has_id and has_title and (has_company or has_apply)
+
+    if len(_IS_JOB_CACHE) >= _IS_JOB_CACHE_MAX:
+        _IS_JOB_CACHE.clear()
+    _IS_JOB_CACHE[keys] = result
+    return result
+
+
+class _JobShape:
+    def __init__(self) -> None:
+        self.path: tuple[str, ...] | None = None
+        self.fingerprint: tuple[frozenset, ...] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _follow(self, obj: Any) -> tuple[list | None, tuple[frozenset, ...]]:
+        node = obj
+        prints = []
+        for key in self.path or ():
+            if not isinstance(node, dict):
+                return None, ()
+            prints.append(frozenset(node))
+            node = node.get(key)
+        return (node if isinstance(node, list) else None), tuple(prints)
+
+    def lookup(self, obj: Any) -> list[dict] | None:
+        if self.path is None:
+            return None
+        container, fingerprint = self._follow(obj)
+        if container is None or fingerprint != self.fingerprint:
+            return None
+        jobs = [x for x in container if isinstance(x, dict) and _is_job(x)]
+        return jobs or None
+
+    def learn(self, obj: Any, jobs: list[dict]) -> None:
+        self.path = self.fingerprint = None
+        if not jobs or not isinstance(obj, dict):
+            return
+
+        # Only a single list, reached through dict keys, that holds every job found is worth caching.
+        wanted = {id(j) for j in jobs}
+        stack: list[tuple[dict, tuple[str, ...]]] = [(obj, ())]
+        while stack:
+            node, path = stack.pop()
+            for k, v in node.items():
+                if isinstance(v, list):
+                    if sum(1 for x in v if id(x) in wanted) == len(wanted) == len(jobs):
+                        self.path = (*path, k)
+                        _, self.fingerprint = self._follow(obj)
+                        return
+                elif isinstance(v, dict) and len(path) < 8:
+                    stack.append((v, (*path, k)))
+
+
+WALK_MAX_DEPTH = 64
+WALK_MAX_NODES = 1_000_000
+WALK_STATS = {"walks": 0, "nodes": 0}
+WALK_PRUNE_KEYS = frozenset({"socialConnections", "jdCoreSkills", "skillMatchingScores"})
+
+
+def _extract_job_dicts(
+    obj: Any,
+    shape: _JobShape | None = None,
+    max_depth: int = WALK_MAX_DEPTH,
+    max_nodes: int = WALK_MAX_NODES,
+    prune: frozenset[str] = WALK_PRUNE_KEYS,
+) -> list[dict]:
+    if shape is not None:
+        fast = shape.lookup(obj)
+        if fast is not None:
+            shape.hits += 1
+            return fast
+        shape.misses += 1
 
     jobs: list[dict] = []
+    nodes = 0
+    truncated = False
+    is_job = _is_job
+    add_job = jobs.append
+
+    # A stack of child iterators instead of recursion: pre-order is preserved and depth is just len(stack).
+    # Decoded JSON only holds plain dicts and lists, so exact type checks are safe and cheaper than isinstance.
+    stack: list[Iterator[Any]] = [iter((obj,))]
+    push = stack.append
+    while stack:
+        for x in stack[-1]:
+            t = type(x)
+            if t is dict:
+                nodes += 1
+                if nodes > max_nodes:
+                    break
+                if is_job(x):
+                    add_job(x)
+                if len(stack) < max_depth:
+                    if prune.isdisjoint(x):
+                        push(iter(x.values()))
+                    else:
+                        push(iter([v for k, v in x.items() if k not in prune]))
+                    break
+                if not truncated:
+                    truncated = any(type(v) is dict or type(v) is list for k, v in x.items() if k not in prune)
+            elif t is list:
+                nodes += 1
+                if nodes > max_nodes:
+                    break
+                if len(stack) < max_depth:
+                    push(iter(x))
+                    break
+                if not truncated:
+                    truncated = any(type(v) is dict or type(v) is list for v in x)
+        else:
+            stack.pop()
+            continue
+        if nodes > max_nodes:
+            print(f"[WARN] Payload walk stopped after {max_nodes} nodes; some jobs may be missing.")
+            break
 
-    def is_job(d: dict) -> bool:
-        keys = set(d.keys())
+    WALK_STATS["walks"] += 1
+    WALK_STATS["nodes"] += min(nodes, max_nodes)
+    if truncated:
+        print(f"[WARN] Payload nested deeper than {max_depth} levels; deeper parts were skipped.")
+    if shape is not None:
+        shape.learn(obj, jobs)
+    return jobs
 
-        if keys & PROFILE_KEYS:
-            return False
 
-        has_id = bool(keys & ID_KEYS)
-        has_title = bool(keys & TITLE_KEYS)
-        has_company = bool(keys & COMPANY_KEYS)
-        has_apply = bool(keys & APPLY_KEYS)
+_STREAM_TOKEN = re.compile(r'["{}\[\]]')
+_STREAM_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+STREAM_CHUNK = 64 * 1024
 
-        return has_id and has_title and (has_company or has_apply)
 
-    def walk(x: Any) -> None:
-        if isinstance(x, dict):
-            if is_job(x):
-                jobs.append(x)
-            for v in x.values():
-                walk(v)
-        elif isinstance(x, list):
-            for i in x:
-                walk(i)
+def _byte_chunks(body: bytes, size: int = STREAM_CHUNK) -> Iterator[bytes]:
+    view = memoryview(body)
+    for i in range(0, len(view), size):
+        yield view[i : i + size]
 
-    walk(obj)
-    return jobs
+
+def _iter_job_dicts_stream(chunks: Iterable[bytes]) -> Iterator[dict]:
+    # Objects that are array elements are decoded one at a time and searched for jobs; everything above them
+    # (the envelope objects and arrays) is only scanned for brackets, never materialized.
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    source = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+    stack: list[str] = []
+    elem_start = -1
+    elem_depth = 0
+
+    while True:
+        m = _STREAM_TOKEN.search(buf, pos)
+        tail = None
+        if m is not None and m.group() == '"':
+            tail = _STREAM_STRING_TAIL.match(buf, m.end())
+
+        if m is None or (m.group() == '"' and tail is None):
+            if eof:
+                break
+            # Keep the unfinished element (or string) and drop everything already scanned.
+            keep = elem_start if elem_start >= 0 else (m.start() if m is not None else len(buf))
+            resume = (m.start() if m is not None else len(buf)) - keep
+            buf = buf[keep:]
+            if elem_start >= 0:
+                elem_start = 0
+            pos = resume
+            chunk = next(source, None)
+            if chunk is None:
+                eof = True
+                buf += decoder.decode(b"", final=True)
+            else:
+                buf += decoder.decode(bytes(chunk))
+            continue
+
+        c = m.group()
+        if tail is not None:
+            pos = tail.end()
+            continue
+        pos = m.end()
+
+        if elem_start >= 0:
+            elem_depth += 1 if c in "{[" else -1
+            if elem_depth == 0:
+                elem = _json_loads(buf[elem_start:pos])
+                elem_start = -1
+                yield from _extract_job_dicts(elem)
+            continue
+
+        if c == "{" and stack and stack[-1] == "[":
+            elem_start = m.start()
+            elem_depth = 1
+        elif c in "{[":
+            stack.append(c)
+        elif stack:
+            stack.pop()
+
+    if elem_start >= 0 or stack:
+        raise ValueError("Truncated JSON payload")
+
+
+def _iter_page_jobs_stream(body: bytes) -> Iterator[dict]:
+    found = False
+    for j in _iter_job_dicts_stream(_byte_chunks(body)):
+        found = True
+        yield j
+    if not found:
+        # A job that is a dict value or the whole document is never an array element, so the scanner can't see it.
+        yield from _extract_job_dicts(_json_loads(body))
+
+
+JOB_FIELDS: dict[str, tuple[str, ...]] = {
+    "jobId": ("jobInfoId", "jobId", "id", "job_id", "jobID"),
+    "title": ("jobTitle", "title", "positionTitle", "name"),
+    "company": ("companyName", "company", "company_name"),
+    "company_alt": ("jdCompanyName", "companyDisplayName", "companyTitle"),
+    "location": ("jobLocation", "location", "locationName", "city"),
+    "apply_url": ("applyUrl", "applyURL", "applyLink", "externalUrl", "sourceUrl", "url", "originalUrl"),
+    "jobright_url": ("detailUrl", "jobUrl", "infoUrl", "jobrightUrl"),
+}
+
+
+_JOB_FIELD_ITEMS = tuple(JOB_FIELDS.items())
+
+
+def _extract_fields(d: dict) -> dict[str, Any]:
+    # One pass over the precomputed table; same first-non-None semantics as _pick.
+    get = d.get
+    out: dict[str, Any] = {}
+    for field, keys in _JOB_FIELD_ITEMS:
+        v = None
+        for k in keys:
+            v = get(k)
+            if v is not None:
+                break
+        out[field] = v
+    return out
 
 
 _COMPANY_FROM_SUMMARY = re.compile(r"^([A-Z][A-Za-z0-9&.,'’\- ]{1,80})\s+is\s+", re.UNICODE)
@@ -86,15 +732,11 @@ _COMPANY_FROM_LOGO = re.compile(r"/([A-Za-z0-9-]+)_logo", re.IGNORECASE)
 
 
 def extract_company(job: dict) -> str | None:
-    company = _pick(
-        job,
-        "companyName",
-        "company",
-        "company_name",
-        "jdCompanyName",
-        "companyDisplayName",
-        "companyTitle",
-    )
+    return _company_from_fields(job, _extract_fields(job))
+
+
+def _company_from_fields(job: dict, fields: dict[str, Any]) -> str | None:
+    company = fields["company"] if fields["company"] is not None else fields["company_alt"]
     if isinstance(company, dict):
         company = _pick(company, "name", "companyName")
     if isinstance(company, str) and company.strip():
@@ -199,146 +841,1232 @@ def extract_keywords(job: dict, max_kw: int = 25) -> list[str]:
     return out
 
 
-def fetch_recommendations_via_api(max_items: int, sort_condition: int = 0, page_size: int = 10) -> list[dict]:
-    out: list[dict] = []
-    seen_ids: set[str] = set()
+def _norm_url(u: Any) -> str | None:
+    if not isinstance(u, str) or not u.strip():
+        return None
+    u = u.strip()
+    return urljoin(BASE, u) if u.startswith("/") else u
+
+
+def _job_id(j: dict, fields: dict[str, Any] | None = None) -> str | None:
+    job_id = (fields if fields is not None else _extract_fields(j))["jobId"]
+    return str(job_id) if job_id is not None else None
+
+
+RAW_MODES = ("full", "none", "projected", "store")
+RAW_PROJECTION = (
+    "jobSummary",
+    "jdLogo",
+    "firstTaxonomy",
+    "jobTaxonomyV3",
+    "recommendationTags",
+    "jobTags",
+)
+RAW_STORE_DIR = "jobright_raw"
+
+
+class _RawStore:
+    def __init__(self, root: str = RAW_STORE_DIR):
+        self.root = root
+        self.written = 0
+        self.reused = 0
+
+    def put(self, j: dict) -> str:
+        blob = json.dumps(j, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(blob).hexdigest()
+        path = os.path.join(self.root, digest[:2], f"{digest}.json")
+        if os.path.exists(path):
+            self.reused += 1
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+            self.written += 1
+        return f"sha256:{digest}"
+
+    def get(self, ref: str) -> dict:
+        digest = ref.split(":", 1)[-1]
+        with open(os.path.join(self.root, digest[:2], f"{digest}.json"), "rb") as f:
+            return json.loads(f.read())
+
+
+def _normalize_job(
+    j: dict,
+    job_id_str: str | None,
+    raw_mode: str = "full",
+    raw_keys: Sequence[str] = RAW_PROJECTION,
+    raw_store: _RawStore | None = None,
+    fields: dict[str, Any] | None = None,
+) -> dict:
+    if fields is None:
+        fields = _extract_fields(j)
+
+    title = fields["title"]
+
+    company = fields["company"]
+    if isinstance(company, dict):
+        company = _pick(company, "name", "companyName")
+    if not company:
+        company = _company_from_fields(j, fields)
+
+    location = fields["location"]
+    if isinstance(location, dict):
+        location = _pick(location, "name", "displayName")
+
+    apply_url = _norm_url(fields["apply_url"])
+
+    jobright_url = _norm_url(fields["jobright_url"])
+    if jobright_url is None and job_id_str:
+        jobright_url = f"{BASE}/jobs/info/{job_id_str}"
+
+    linkedin_recruiters = extract_linkedin_recruiters(j)
+    keywords = extract_keywords(j)
+
+    record = {
+        "jobId": job_id_str,
+        "title": title,
+        "company": company,
+        "location": location,
+        "jobright_url": jobright_url,
+        "apply_url": apply_url,
+        "linkedin_recruiters": linkedin_recruiters,
+        "keywords": keywords,
+    }
+    if raw_mode == "full":
+        record["raw"] = j
+    elif raw_mode == "projected":
+        record["raw"] = {k: j[k] for k in raw_keys if k in j}
+    elif raw_mode == "store":
+        record["raw_ref"] = (raw_store or _RawStore()).put(j)
+    return record
+
+
+def _api_url(position: int, count: int, refresh: str, sort_condition: int) -> str:
+    qs = urlencode(
+        {
+            "refresh": refresh,
+            "sortCondition": str(sort_condition),
+            "position": str(position),
+            "count": str(count),
+        }
+    )
+    return f"{RECS_API}?{qs}"
 
-    def norm_url(u: Any) -> str | None:
-        if not isinstance(u, str) or not u.strip():
-            return None
-        u = u.strip()
-        return urljoin(BASE, u) if u.startswith("/") else u
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(storage_state=STATE_FILE)
+def _api_headers() -> dict[str, str]:
+    return {
+        "accept": "application/json",
+        "referer": RECS_PAGE,
+        "origin": BASE,
+    }
 
-        page = context.new_page()
+
+PageSink = Callable[[list[dict]], None]
+SEEN_DB = "jobright_seen.db"
+
+
+class _BloomFilter:
+    MAGIC = b"JRBF1"
+    _HEADER = struct.Struct("<5sQQQQ")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.m = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.k = max(1, round(self.m / self.capacity * math.log(2)))
+        self.count = 0
+        self.bits = bytearray((self.m + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.m for i in range(self.k)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: str) -> None:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._HEADER.pack(self.MAGIC, self.capacity, self.m, self.k, self.count))
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> _BloomFilter | None:
         try:
-            page.goto(RECS_PAGE, wait_until="domcontentloaded", timeout=60_000)
-        except PWTimeoutError:
-            pass
-        page.wait_for_timeout(1500)
+            with open(path, "rb") as f:
+                magic, capacity, m, k, count = cls._HEADER.unpack(f.read(cls._HEADER.size))
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+        if magic != cls.MAGIC or len(bits) != (m + 7) // 8:
+            return None
+        bf = cls.__new__(cls)
+        bf.capacity, bf.m, bf.k, bf.count, bf.bits = capacity, m, k, count, bits
+        return bf
+
+
+class _SeenStore:
+    def __init__(self, path: str = SEEN_DB, bloom_capacity: int = 1_000_000):
+        self.path = path
+        self.bloom_path = f"{path}.bloom"
+        self.exact_checks = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS seen (jobId TEXT PRIMARY KEY, first_seen TEXT NOT NULL)")
+
+        # The filter is only a cache of the table: rebuild it when it is missing, stale or over capacity.
+        total = len(self)
+        bloom = _BloomFilter.load(self.bloom_path)
+        if bloom is None or bloom.count != total or total > bloom.capacity:
+            bloom = _BloomFilter(max(bloom_capacity, total * 2))
+            for (job_id,) in self._db.execute("SELECT jobId FROM seen"):
+                bloom.add(job_id)
+            bloom.save(self.bloom_path)
+        self.bloom = bloom
+
+    def __contains__(self, job_id: str) -> bool:
+        if job_id not in self.bloom:
+            return False
+        self.exact_checks += 1
+        return self._db.execute("SELECT 1 FROM seen WHERE jobId = ?", (job_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def add_many(self, job_ids: Sequence[str]) -> None:
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._db:
+            before = self._db.total_changes
+            for job_id in job_ids:
+                self._db.execute("INSERT OR IGNORE INTO seen (jobId, first_seen) VALUES (?, ?)", (job_id, now))
+                if self._db.total_changes != before:
+                    self.bloom.add(job_id)
+                    before = self._db.total_changes
+
+    def close(self) -> None:
+        self.bloom.save(self.bloom_path)
+        self._db.close()
+
+
+CHECKPOINT_FILE = "jobright_checkpoint.json"
+
+
+class _Checkpoint:
+    def __init__(self, path: str = CHECKPOINT_FILE, resume: bool = False):
+        self.path = path
+        self.records_path = f"{path}.records.ndjson"
+        self.complete = False
+        self.state: dict | None = None
+        self.records: list[dict] = []
+        if resume:
+            self._load()
+        else:
+            self._remove()
+        self._records_f = open(self.records_path, "a", encoding="utf-8")
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            print(f"[INFO] No checkpoint at {self.path}, starting from the beginning")
+            self._remove()
+            return
+
+        # Lines past the saved count belong to a page whose state never made it to disk.
+        records: list[dict] = []
+        if os.path.exists(self.records_path):
+            with open(self.records_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if len(records) >= state["emitted"]:
+                        break
+                    records.append(json.loads(line))
+        with open(self.records_path, "w", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(r))
+                f.write("\n")
+
+        self.state = state
+        self.records = records
+
+    def save(self, pg: _Pagination, records: list[dict]) -> None:
+        if pg.collect:
+            for r in records:
+                self._records_f.write(json.dumps(r))
+                self._records_f.write("\n")
+            self._records_f.flush()
+            self.records.extend(records)
+
+        self.state = {
+            "position": pg.position,
+            "refresh": pg.refresh,
+            "sort_condition": pg.sort_condition,
+            "page_size": pg.page_size,
+            "collect": pg.collect,
+            "emitted": pg.emitted,
+            "seen_ids": sorted(pg.seen_ids),
+        }
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.path)
+
+    def _remove(self) -> None:
+        for path in (self.path, self.records_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def close(self) -> None:
+        self._records_f.close()
+
+    def finish(self) -> None:
+        self.close()
+        if self.complete:
+            self._remove()
+        elif self.state is not None:
+            print(f"[INFO] Run stopped early; checkpoint kept at {self.path}. Rerun with --resume to continue.")
+
+
+class _Pagination:
+    def __init__(
+        self,
+        max_items: int,
+        sort_condition: int,
+        page_size: int,
+        sinks: Sequence[PageSink] = (),
+        collect: bool = True,
+        raw_mode: str = "full",
+        raw_keys: Sequence[str] = RAW_PROJECTION,
+        raw_store: _RawStore | None = None,
+        known: _SeenStore | None = None,
+        stop_after_known: int = 0,
+        checkpoint: _Checkpoint | None = None,
+        stream_parse: bool = False,
+    ):
+        if raw_mode not in RAW_MODES:
+            raise ValueError(f"raw_mode must be one of {RAW_MODES}, got {raw_mode!r}")
+        self.max_items = max_items
+        self.sort_condition = sort_condition
+        self.page_size = page_size
+        self.sinks = tuple(sinks)
+        self.collect = collect
+        self.raw_mode = raw_mode
+        self.raw_keys = tuple(raw_keys)
+        self.raw_store = raw_store if raw_store is not None or raw_mode != "store" else _RawStore()
+        self.stream_parse = stream_parse
+        self.known = known
+        self.stop_after_known = stop_after_known
+        self.known_run = 0
+        self.known_skipped = 0
+        self.out: list[dict] = []
+        self.emitted = 0
+        self.seen_ids: set[str] = set()
+        self.shape = _JobShape()
+        self.position = 0
+        self.refresh = "true"
+        self.done = max_items <= 0
+
+        self.checkpoint = checkpoint
+        if checkpoint is not None and checkpoint.state is not None:
+            st = checkpoint.state
+            expected = {"sort_condition": sort_condition, "page_size": page_size, "collect": collect}
+            changed = [f"{k}={st.get(k)!r} (now {v!r})" for k, v in expected.items() if st.get(k) != v]
+            if changed:
+                # collect=False is --format ndjson: its jobs are in the output file, not the checkpoint.
+                raise ValueError(
+                    f"Checkpoint {checkpoint.path} was saved with {', '.join(changed)}. "
+                    "Resume with the original --format, or drop --resume to start over."
+                )
+            self.position = st["position"]
+            self.refresh = st["refresh"]
+            self.emitted = st["emitted"]
+            self.seen_ids = set(st["seen_ids"])
+            if collect:
+                self.out = list(checkpoint.records)
+            self.done = self.emitted >= max_items
+            print(f"[INFO] Resuming at position={self.position} with {self.emitted} jobs already fetched")
+
+    @property
+    def remaining(self) -> int:
+        return self.max_items - self.emitted
+
+    def next_request(self) -> tuple[int, str]:
+        count = min(self.page_size, self.remaining)
+        return count, _api_url(self.position, count, self.refresh, self.sort_condition)
+
+    def consume(self, url: str, count: int, status: int, body: bytes) -> None:
+        METRICS.inc("jobright_http_responses_total", code=status)
+        METRICS.inc("jobright_response_bytes_total", len(body))
+        if status in (401, 403):
+            raise PermissionError(f"Auth failed calling {url} (HTTP {status}). Run with --login again.")
+
+        if status != 200:
+            print(f"[WARN] API returned HTTP {status} at position={self.position}. Stopping.")
+            self.done = True
+            return
+
+        data: Any = None
+        if self.stream_parse:
+            job_dicts: Iterable[dict] = _iter_page_jobs_stream(body)
+        else:
+            with _span("json.decode"):
+                data = _json_loads(body)
+            MEMPROF.page("page.decode", position=self.position)
+            with _span("extract.jobs"):
+                job_dicts = _extract_job_dicts(data, self.shape)
+
+        records: list[dict] = []
+        found = 0
+        fresh = 0
+        caught_up = False
+        with _span("extract.batch"):
+            for j in job_dicts:
+                found += 1
+                with _span("extract.fields"):
+                    fields = _extract_fields(j)
+                job_id_str = _job_id(j, fields)
+                dupe = bool(job_id_str) and job_id_str in self.seen_ids
+                if not dupe:
+                    fresh += 1
+
+                if self.known is not None and job_id_str and (dupe or job_id_str in self.known):
+                    if not dupe:
+                        self.seen_ids.add(job_id_str)
+                        self.known_skipped += 1
+                    self.known_run += 1
+                    if self.stop_after_known and self.known_run >= self.stop_after_known:
+                        caught_up = True
+                        break
+                    continue
+                if dupe:
+                    continue
+                self.known_run = 0
 
-        position = 0
-        refresh = "true"
+                with _span("normalize.job"):
+                    record = _normalize_job(j, job_id_str, self.raw_mode, self.raw_keys, self.raw_store, fields)
+                records.append(record)
+                if job_id_str:
+                    self.seen_ids.add(job_id_str)
+                if self.emitted + len(records) >= self.max_items:
+                    break
 
-        while len(out) < max_items:
-            count = min(page_size, max_items - len(out))
-            qs = urlencode(
-                {
-                    "refresh": refresh,
-                    "sortCondition": str(sort_condition),
-                    "position": str(position),
-                    "count": str(count),
-                }
-            )
-            url = f"{RECS_API}?{qs}"
-
-            resp = page.request.get(
-                url,
-                headers={
-                    "accept": "application/json",
-                    "referer": RECS_PAGE,
-                    "origin": BASE,
-                },
-            )
+        if self.stream_parse:
+            # Decoding and extraction are interleaved here, so the decode boundary is the end of the scan.
+            MEMPROF.page("page.decode", position=self.position, streamed=True)
+        MEMPROF.page("page.extract", position=self.position, jobs=len(records))
+
+        if not found:
+            with open("jobright_debug_payload.json", "w", encoding="utf-8") as f:
+                if data is None:
+                    f.write(bytes(body).decode("utf-8", errors="replace"))
+                else:
+                    json.dump(data, f, indent=2)
+            print("[INFO] No job objects found. Dumped jobright_debug_payload.json")
+            self.done = True
+            if self.checkpoint is not None:
+                self.checkpoint.complete = True
+            return
+
+        METRICS.inc("jobright_pages_fetched_total")
+        METRICS.inc("jobright_jobs_emitted_total", len(records))
+        METRICS.inc("jobright_duplicates_skipped_total", found - len(records))
+
+        if caught_up:
+            print(f"[INFO] Hit {self.known_run} already-known jobs in a row at position={self.position}. Stopping.")
+
+        if records:
+            for sink in self.sinks:
+                with _span("sink.write"):
+                    sink(records)
+            if self.collect:
+                self.out.extend(records)
+            self.emitted += len(records)
+
+        self.position += count
+        self.refresh = "false"
+        self.done = not fresh or caught_up or self.emitted >= self.max_items
+
+        if self.checkpoint is not None:
+            self.checkpoint.save(self, records)
+            self.checkpoint.complete = self.done
+        # Only once every sink has the page and the checkpoint is past it: a crash before this point makes a
+        # resumed run fetch the page again, and it must not find those jobs already known.
+        if self.known is not None and records:
+            self.known.add_many([r["jobId"] for r in records if r["jobId"]])
+
+
+def _paginate(
+    get: Callable[[str], tuple[int, bytes]],
+    max_items: int,
+    sort_condition: int,
+    page_size: int,
+    pipeline_depth: int = 0,
+    pager: _Pagination | None = None,
+    **pager_opts: Any,
+) -> list[dict]:
+    if pipeline_depth > 0:
+        return _paginate_pipelined(get, max_items, sort_condition, page_size, pipeline_depth, pager, **pager_opts)
+
+    pg = pager if pager is not None else _Pagination(max_items, sort_condition, page_size, **pager_opts)
+    while not pg.done:
+        count, url = pg.next_request()
+        with _span("api.request"):
+            status, body = get(url)
+        pg.consume(url, count, status, body)
+    return pg.out
+
+
+def _paginate_pipelined(
+    get: Callable[[str], tuple[int, bytes]],
+    max_items: int,
+    sort_condition: int,
+    page_size: int,
+    depth: int,
+    pager: _Pagination | None = None,
+    **pager_opts: Any,
+) -> list[dict]:
+    pg = pager if pager is not None else _Pagination(max_items, sort_condition, page_size, **pager_opts)
+    pages: queue.Queue[tuple[str, int, int, bytes] | None] = queue.Queue(maxsize=depth)
+    lock = threading.Lock()
+    unconsumed = 0
+    errors: list[BaseException] = []
+
+    # get() stays on the calling thread (Playwright objects are bound to it); parsing and extraction run here.
+    def consumer() -> None:
+        nonlocal unconsumed
+        while True:
+            item = pages.get()
+            try:
+                if item is None:
+                    return
+                if not pg.done and not errors:
+                    pg.consume(*item)
+            except BaseException as e:
+                errors.append(e)
+                pg.done = True
+            finally:
+                if item is not None:
+                    with lock:
+                        unconsumed -= item[1]
+                pages.task_done()
+
+    worker = threading.Thread(target=consumer, name="jobright-extract", daemon=True)
+    worker.start()
+    try:
+        position = pg.position
+        refresh = pg.refresh
+        while not pg.done:
+            with lock:
+                count = min(pg.page_size, pg.remaining - unconsumed)
+            if count <= 0:
+                # Everything still needed is already queued; see whether dedupe leaves a gap to fill.
+                pages.join()
+                continue
+
+            url = _api_url(position, count, refresh, pg.sort_condition)
+            with _span("api.request"):
+                status, body = get(url)
+            with lock:
+                unconsumed += count
+            pages.put((url, count, status, body))
+
+            if status != 200:
+                break
+            position += count
+            refresh = "false"
+    finally:
+        pages.put(None)
+        worker.join()
+
+    if errors:
+        raise errors[0]
+    return pg.out
+
+
+async def _paginate_async(
+    get: Callable[[str], Awaitable[tuple[int, bytes]]],
+    max_items: int,
+    sort_condition: int,
+    page_size: int,
+    concurrency: int,
+    pager: _Pagination | None = None,
+    **pager_opts: Any,
+) -> list[dict]:
+    pg = pager if pager is not None else _Pagination(max_items, sort_condition, page_size, **pager_opts)
+    if pg.done:
+        return pg.out
+
+    async def timed_get(url: str) -> tuple[int, bytes]:
+        with _span("api.request", overlap=True):
+            return await get(url)
+
+    # The refresh=true page resets the server-side list, so it has to land before the rest are requested.
+    count, url = pg.next_request()
+    pg.consume(url, count, *await timed_get(url))
+
+    pending: deque[tuple[str, int, asyncio.Task]] = deque()
+    next_position = pg.position
+    try:
+        while not pg.done:
+            planned = sum(c for _, c, _ in pending)
+            while len(pending) < max(1, concurrency) and planned < pg.remaining:
+                count = min(pg.page_size, pg.remaining - planned)
+                url = _api_url(next_position, count, pg.refresh, pg.sort_condition)
+                pending.append((url, count, asyncio.ensure_future(timed_get(url))))
+                next_position += count
+                planned += count
+
+            url, count, task = pending.popleft()
+            pg.consume(url, count, *await task)
+    finally:
+        for _, _, task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*(t for _, _, t in pending), return_exceptions=True)
+
+    return pg.out
+
+
+READY_WAITS: list[dict] = []
 
-            if resp.status in (401, 403):
+
+def _is_recs_response(resp: Any) -> bool:
+    return resp.ok and resp.url.split("?", 1)[0] == RECS_API
+
+
+def _open_recs_page(page: Any, ceiling_ms: int, label: str, nav_timeout_ms: int = 60_000) -> float:
+    hits: list[Any] = []
+
+    def on_response(resp: Any) -> None:
+        if _is_recs_response(resp):
+            hits.append(resp)
+
+    page.on("response", on_response)
+    try:
+        with _span("page.goto"):
+            try:
+                page.goto(RECS_PAGE, wait_until="domcontentloaded", timeout=nav_timeout_ms)
+            except PWTimeoutError:
+                pass
+
+        t0 = time.perf_counter()
+        if not hits:
+            with _span("page.ready_wait"):
                 try:
-                    page.goto(RECS_PAGE, wait_until="domcontentloaded", timeout=60_000)
+                    page.wait_for_event("response", predicate=_is_recs_response, timeout=max(1, ceiling_ms))
+                    hits.append(True)
                 except PWTimeoutError:
                     pass
-                page.wait_for_timeout(1200)
-                resp = page.request.get(
-                    url,
-                    headers={
-                        "accept": "application/json",
-                        "referer": RECS_PAGE,
-                        "origin": BASE,
-                    },
-                )
+        waited_ms = (time.perf_counter() - t0) * 1000
+    finally:
+        page.remove_listener("response", on_response)
 
-            if resp.status in (401, 403):
-                browser.close()
-                raise PermissionError(f"Auth failed calling {url} (HTTP {resp.status}). Run with --login again.")
+    READY_WAITS.append({"label": label, "waited_ms": round(waited_ms, 1), "ready": bool(hits)})
+    if hits:
+        print(f"[INFO] {label}: recommendations loaded after {waited_ms:.0f} ms")
+    else:
+        print(f"[INFO] {label}: no recommendations request within {ceiling_ms} ms, continuing")
+    return waited_ms
 
-            if resp.status != 200:
-                print(f"[WARN] API returned HTTP {resp.status} at position={position}. Stopping.")
-                break
 
-            data = resp.json()
-            job_dicts = _extract_job_dicts(data)
+def _browser_get(page: Any, url: str) -> tuple[int, bytes]:
+    resp = page.request.get(url, headers=_api_headers())
 
-            if not job_dicts:
-                with open("jobright_debug_payload.json", "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
-                print("[INFO] No job objects found. Dumped jobright_debug_payload.json")
-                break
+    if resp.status in (401, 403):
+        METRICS.inc("jobright_auth_retries_total")
+        _open_recs_page(page, 1200, "auth retry")
+        resp = page.request.get(url, headers=_api_headers())
 
-            added = 0
-            for j in job_dicts:
-                job_id = _pick(j, "jobInfoId", "jobId", "id", "job_id", "jobID")
-                job_id_str = str(job_id) if job_id is not None else None
-                if job_id_str and job_id_str in seen_ids:
+    return resp.status, resp.body()
+
+
+def _make_browser_get(context: Any, preflight: bool) -> Callable[[str], tuple[int, bytes]]:
+    page = None
+    if not preflight:
+        page = context.new_page()
+        _open_recs_page(page, 1500, "warm-up")
+
+    def get(url: str) -> tuple[int, bytes]:
+        nonlocal page
+        if page is not None:
+            return _browser_get(page, url)
+
+        resp = context.request.get(url, headers=_api_headers())
+        if resp.status not in (401, 403):
+            return resp.status, resp.body()
+
+        print(f"[INFO] Preflight got HTTP {resp.status}, loading {RECS_PAGE}")
+        page = context.new_page()
+        _open_recs_page(page, 1200, "preflight fallback")
+        resp = page.request.get(url, headers=_api_headers())
+        return resp.status, resp.body()
+
+    return get
+
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "texttrack", "manifest"})
+
+
+def _install_resource_blocking(context: Any, allow_hosts: tuple[str, ...] = ()) -> dict[str, int]:
+    hosts = {h.lower().lstrip(".") for h in (urlparse(BASE).hostname or "", *allow_hosts) if h}
+    counts = {"allowed": 0, "blocked": 0}
+
+    def handle(route: Any) -> None:
+        req = route.request
+        host = (urlparse(req.url).hostname or "").lower()
+        first_party = any(host == h or host.endswith("." + h) for h in hosts)
+        if req.resource_type in BLOCKED_RESOURCE_TYPES or not first_party:
+            counts["blocked"] += 1
+            route.abort()
+        else:
+            counts["allowed"] += 1
+            route.continue_()
+
+    context.route("**/*", handle)
+    return counts
+
+
+def fetch_recommendations_via_api(
+    max_items: int,
+    sort_condition: int = 0,
+    page_size: int = 10,
+    preflight: bool = False,
+    block_resources: bool = False,
+    allow_hosts: tuple[str, ...] = (),
+    pipeline_depth: int = 0,
+    pager: _Pagination | None = None,
+    **pager_opts: Any,
+) -> list[dict]:
+    with sync_playwright() as p:
+        with _span("browser.launch"):
+            browser = p.chromium.launch(headless=True)
+        try:
+            with _span("browser.context"):
+                context = browser.new_context(storage_state=STATE_FILE)
+            MEMPROF.mark("browser.context")
+            blocked = _install_resource_blocking(context, allow_hosts) if block_resources else None
+
+            out = _paginate(
+                _make_browser_get(context, preflight),
+                max_items,
+                sort_condition,
+                page_size,
+                pipeline_depth,
+                pager,
+                **pager_opts,
+            )
+
+            context.storage_state(path=STATE_FILE)
+        finally:
+            browser.close()
+
+    if blocked is not None:
+        print(f"[INFO] Navigation requests: {blocked['blocked']} blocked, {blocked['allowed']} allowed")
+    return out
+
+
+def _state_cookies(path: str, url: str) -> dict[str, str]:
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    req_path = parsed.path or "/"
+    now = time.time()
+
+    jar: dict[str, str] = {}
+    for c in state.get("cookies") or []:
+        if not isinstance(c, dict) or not c.get("name"):
+            continue
+        domain = (c.get("domain") or "").lower().lstrip(".")
+        if domain and host != domain and not host.endswith("." + domain):
+            continue
+        if not req_path.startswith(c.get("path") or "/"):
+            continue
+        expires = c.get("expires")
+        if isinstance(expires, (int, float)) and 0 < expires < now:
+            continue
+        if c.get("secure") and parsed.scheme != "https":
+            continue
+        jar[c["name"]] = c.get("value") or ""
+    return jar
+
+
+def _parse_set_cookie(header: str, host: str, now: float) -> dict | None:
+    jar: SimpleCookie = SimpleCookie()
+    try:
+        jar.load(header)
+    except CookieError:
+        return None
+    for name, m in jar.items():
+        expires: float = -1
+        try:
+            if m["max-age"]:
+                expires = now + int(m["max-age"])
+            elif m["expires"]:
+                expires = email.utils.parsedate_to_datetime(m["expires"]).timestamp()
+        except (TypeError, ValueError):
+            pass
+        # Same shape as the cookies in Playwright's storage_state.
+        return {
+            "name": name,
+            "value": m.value,
+            "domain": m["domain"] or host,
+            "path": m["path"] or "/",
+            "expires": expires,
+            "httpOnly": bool(m["httponly"]),
+            "secure": bool(m["secure"]),
+            "sameSite": (m["samesite"] or "Lax").capitalize(),
+        }
+    return None
+
+
+def _save_state_cookies(path: str, updates: Iterable[dict]) -> int:
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+
+    def key(c: dict) -> tuple[str, str, str]:
+        return c.get("name") or "", (c.get("domain") or "").lower().lstrip("."), c.get("path") or "/"
+
+    cookies = {key(c): c for c in state.get("cookies") or [] if isinstance(c, dict)}
+    now = time.time()
+    for c in updates:
+        if 0 <= c["expires"] < now:
+            cookies.pop(key(c), None)
+        else:
+            cookies[key(c)] = c
+    state["cookies"] = list(cookies.values())
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+    return len(cookies)
+
+
+class _HttpClient:
+    def __init__(self, cookies: dict[str, str], timeout: float = 60.0):
+        self.cookies = dict(cookies)
+        self.set_cookies: dict[tuple[str, str, str], dict] = {}
+        self.timeout = timeout
+        self._conns: dict[tuple[str, str, int | None], http.client.HTTPConnection] = {}
+
+    def _conn(self, scheme: str, host: str, port: int | None) -> http.client.HTTPConnection:
+        key = (scheme, host, port)
+        conn = self._conns.get(key)
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = cls(host, port, timeout=self.timeout)
+            self._conns[key] = conn
+        return conn
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> tuple[int, bytes]:
+        parsed = urlparse(url)
+        target = parsed.path or "/"
+        if parsed.query:
+            target += f"?{parsed.query}"
+
+        h = {"connection": "keep-alive", "accept-encoding": "identity"}
+        h.update(headers or {})
+        if self.cookies:
+            h["cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+
+        for attempt in range(2):
+            conn = self._conn(parsed.scheme, parsed.hostname or "", parsed.port)
+            try:
+                conn.request("GET", target, headers=h)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+
+            now = time.time()
+            for sc in resp.headers.get_all("set-cookie") or []:
+                c = _parse_set_cookie(sc, parsed.hostname or "", now)
+                if c is None:
                     continue
+                self.set_cookies[c["name"], c["domain"], c["path"]] = c
+                if 0 <= c["expires"] < now:
+                    self.cookies.pop(c["name"], None)
+                else:
+                    self.cookies[c["name"]] = c["value"]
+            if resp.will_close:
+                conn.close()
+            return resp.status, body
+
+        raise ConnectionError(f"Could not GET {url}")
+
+    def close(self) -> None:
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+
+def fetch_recommendations_via_http(
+    max_items: int,
+    sort_condition: int = 0,
+    page_size: int = 10,
+    pipeline_depth: int = 0,
+    **pager_opts: Any,
+) -> list[dict]:
+    client = _HttpClient(_state_cookies(STATE_FILE, RECS_API))
+    pg = _Pagination(max_items, sort_condition, page_size, **pager_opts)
+    try:
+        return _paginate(
+            lambda url: client.get(url, headers=_api_headers()),
+            max_items,
+            sort_condition,
+            page_size,
+            pipeline_depth,
+            pg,
+        )
+    except PermissionError as e:
+        _fall_back(pg, e)
+    finally:
+        client.close()
+        # Keep rotated session cookies, as the browser engine does with storage_state; also before a fallback,
+        # so the browser starts from them.
+        if client.set_cookies:
+            _save_state_cookies(STATE_FILE, client.set_cookies.values())
+
+    return fetch_recommendations_via_api(
+        max_items,
+        sort_condition=sort_condition,
+        page_size=page_size,
+        pipeline_depth=pipeline_depth,
+        pager=pg,
+    )
 
-                title = _pick(j, "jobTitle", "title", "positionTitle", "name")
 
-                company = _pick(j, "companyName", "company", "company_name")
-                if isinstance(company, dict):
-                    company = _pick(company, "name", "companyName")
-                if not company:
-                    company = extract_company(j)
+def _fall_back(pg: _Pagination, e: PermissionError) -> None:
+    # Pages before the 401/403 are already in the sinks and the seen store; the browser picks up where we stopped.
+    print(f"[INFO] {e} Falling back to the browser engine at position={pg.position} ({pg.emitted} jobs kept).")
+    METRICS.inc("jobright_engine_fallbacks_total")
+    pg.done = False
 
-                location = _pick(j, "jobLocation", "location", "locationName", "city")
-                if isinstance(location, dict):
-                    location = _pick(location, "name", "displayName")
 
-                apply_url = _pick(
-                    j,
-                    "applyUrl", "applyURL", "applyLink",
-                    "externalUrl", "sourceUrl", "url", "originalUrl",
-                )
-                apply_url = norm_url(apply_url)
-
-                jobright_url = _pick(j, "detailUrl", "jobUrl", "infoUrl", "jobrightUrl")
-                jobright_url = norm_url(jobright_url)
-                if jobright_url is None and job_id_str:
-                    jobright_url = f"{BASE}/jobs/info/{job_id_str}"
-
-                linkedin_recruiters = extract_linkedin_recruiters(j)
-                keywords = extract_keywords(j)
-
-                out.append(
-                    {
-                        "jobId": job_id_str,
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "jobright_url": jobright_url,
-                        "apply_url": apply_url,
-                        "linkedin_recruiters": linkedin_recruiters,
-                        "keywords": keywords,
-                        "raw": j,
-                    }
-                )
-                if job_id_str:
-                    seen_ids.add(job_id_str)
-                added += 1
-                if len(out) >= max_items:
-                    break
+async def _fetch_async(
+    max_items: int,
+    sort_condition: int,
+    page_size: int,
+    concurrency: int,
+    pager: _Pagination,
+) -> list[dict]:
+    async with async_playwright() as p:
+        rc = await p.request.new_context(storage_state=STATE_FILE, extra_http_headers=_api_headers())
+        try:
+            async def get(url: str) -> tuple[int, bytes]:
+                resp = await rc.get(url)
+                return resp.status, await resp.body()
+
+            return await _paginate_async(get, max_items, sort_condition, page_size, concurrency, pager)
+        finally:
+            # Keep rotated session cookies like the other engines; merged so the browser's origins survive.
+            _save_state_cookies(STATE_FILE, (await rc.storage_state())["cookies"])
+            await rc.dispose()
+
+
+def fetch_recommendations_async(
+    max_items: int,
+    sort_condition: int = 0,
+    page_size: int = 10,
+    concurrency: int = 4,
+    **pager_opts: Any,
+) -> list[dict]:
+    pg = _Pagination(max_items, sort_condition, page_size, **pager_opts)
+    try:
+        return asyncio.run(_fetch_async(max_items, sort_condition, page_size, concurrency, pg))
+    except PermissionError as e:
+        _fall_back(pg, e)
 
-            if added == 0:
-                break
+    return fetch_recommendations_via_api(max_items, sort_condition=sort_condition, page_size=page_size, pager=pg)
 
-            position += count
-            refresh = "false"
 
-        context.storage_state(path=STATE_FILE)
-        browser.close()
+def _daemon_token_path(port: int) -> str:
+    return f"jobright_daemon_{port}.token"
 
-    return out
+
+def _write_daemon_token(port: int) -> str:
+    token = secrets.token_urlsafe(32)
+    path = _daemon_token_path(port)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with os.fdopen(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+        f.write(token)
+    os.replace(tmp, path)
+    return token
+
+
+def _read_daemon_token(port: int) -> str | None:
+    try:
+        with open(_daemon_token_path(port), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _daemon_reject(headers: Any, port: int, token: str, need_token: bool) -> str | None:
+    # A DNS-rebinding page arrives with its own Host, and browsers send Origin on cross-site requests, so only
+    # local clients like main() get through; the token additionally keeps other local users' pages out.
+    if headers.get("host") not in (f"127.0.0.1:{port}", f"localhost:{port}"):
+        return "unexpected Host header"
+    if headers.get("origin") is not None:
+        return "cross-origin requests are not allowed"
+    auth = (headers.get("authorization") or "").encode()
+    if need_token and not hmac.compare_digest(auth, f"Bearer {token}".encode()):
+        return "missing or wrong daemon token"
+    return None
+
+
+def serve_daemon(port: int = DAEMON_PORT, block_resources: bool = False, allow_hosts: tuple[str, ...] = ()) -> None:
+    METRICS.enable()
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            context = browser.new_context(storage_state=STATE_FILE)
+            if block_resources:
+                _install_resource_blocking(context, allow_hosts)
+            page = context.new_page()
+            _open_recs_page(page, 1500, "daemon warm-up")
+
+            # Single-threaded on purpose: every handler runs on this thread, which owns the Playwright objects.
+            class Handler(BaseHTTPRequestHandler):
+                def _send(self, code: int, body: bytes, content_type: str = "application/json") -> None:
+                    self.send_response(code)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, fmt: str, *args: Any) -> None:
+                    return
+
+                def _allowed(self, need_token: bool) -> bool:
+                    error = _daemon_reject(self.headers, port, token, need_token)
+                    if error is not None:
+                        self._send(403, json.dumps({"error": error}).encode("utf-8"))
+                    return error is None
+
+                def do_GET(self) -> None:
+                    parsed = urlparse(self.path)
+                    if not self._allowed(need_token=parsed.path == "/get"):
+                        return
+
+                    if parsed.path == "/health":
+                        return self._send(200, json.dumps({"ok": True, "state_file": state_file}).encode("utf-8"))
+
+                    if parsed.path == "/get":
+                        url = (parse_qs(parsed.query).get("url") or [""])[0]
+                        if not url.startswith(f"{RECS_API}?"):
+                            return self._send(400, b'{"error": "url must target the recommendations API"}')
+                        with _span("api.request"):
+                            status, body = _browser_get(page, url)
+                        METRICS.inc("jobright_http_responses_total", code=status)
+                        METRICS.inc("jobright_response_bytes_total", len(body))
+                        return self._send(status, body)
+
+                    if parsed.path == "/metrics":
+                        return self._send(200, METRICS.render().encode("utf-8"), METRICS_CONTENT_TYPE)
+
+                    return self._send(404, b'{"error": "not found"}')
+
+                def do_POST(self) -> None:
+                    if not self._allowed(need_token=True):
+                        return
+                    if urlparse(self.path).path == "/shutdown":
+                        self._send(200, b'{"ok": true}')
+                        threading.Thread(target=httpd.shutdown, daemon=True).start()
+                        return
+                    return self._send(404, b'{"error": "not found"}')
+
+            state_file = os.path.abspath(STATE_FILE)
+            httpd = HTTPServer(("127.0.0.1", port), Handler)
+            token = _write_daemon_token(port)
+            print(f"[OK] Daemon listening on http://127.0.0.1:{port} (Ctrl+C to stop)")
+            print(f"[INFO] Clients authenticate with the token in {_daemon_token_path(port)}")
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                httpd.server_close()
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(_daemon_token_path(port))
+
+            context.storage_state(path=STATE_FILE)
+        finally:
+            browser.close()
+    print("[OK] Daemon stopped")
+
+
+def _daemon_health(port: int) -> dict | None:
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=0.5)
+        try:
+            conn.request("GET", "/health")
+            resp = conn.getresponse()
+            return json.loads(resp.read()) if resp.status == 200 else None
+        finally:
+            conn.close()
+    except (OSError, ValueError):
+        return None
+
+
+def fetch_recommendations_via_daemon(
+    max_items: int,
+    sort_condition: int = 0,
+    page_size: int = 10,
+    port: int = DAEMON_PORT,
+    pipeline_depth: int = 0,
+    **pager_opts: Any,
+) -> list[dict]:
+    token = _read_daemon_token(port)
+    if token is None:
+        raise PermissionError(f"No daemon token at {_daemon_token_path(port)}. Start the daemon from this directory.")
+    client = _HttpClient({})
+    auth = {"authorization": f"Bearer {token}"}
+    try:
+        return _paginate(
+            lambda url: client.get(f"http://127.0.0.1:{port}/get?{urlencode({'url': url})}", auth),
+            max_items,
+            sort_condition,
+            page_size,
+            pipeline_depth,
+            **pager_opts,
+        )
+    finally:
+        client.close()
+
+
+class _NdjsonSink:
+    def __init__(self, path: str, append: bool = False, compact: bool = False, keep: int | None = None):
+        self.path = path
+        self.compact = compact
+        self.count = 0
+        if keep is not None and os.path.exists(path):
+            # Lines past `keep` belong to a page the checkpoint never recorded; the resumed run writes it again.
+            with open(path, "r+b") as f:
+                for _ in range(keep):
+                    if not f.readline():
+                        break
+                f.truncate(f.tell())
+        self._f = open(path, "a" if append or keep is not None else "w", encoding="utf-8")
+
+    def __call__(self, records: list[dict]) -> None:
+        for r in records:
+            self._f.write(_json_dumps(r, self.compact))
+            self._f.write("\n")
+        self._f.flush()
+        self.count += len(records)
+
+    def close(self) -> None:
+        self._f.close()
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    jobId TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    jobright_url TEXT,
+    apply_url TEXT,
+    linkedin_recruiters TEXT,
+    keywords TEXT,
+    raw TEXT,
+    raw_ref TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);
+"""
+
+_SQLITE_UPSERT = """
+INSERT INTO jobs (
+    jobId, title, company, location, jobright_url, apply_url,
+    linkedin_recruiters, keywords, raw, raw_ref, first_seen, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(jobId) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    jobright_url = excluded.jobright_url,
+    apply_url = excluded.apply_url,
+    linkedin_recruiters = excluded.linkedin_recruiters,
+    keywords = excluded.keywords,
+    raw = COALESCE(excluded.raw, jobs.raw),
+    raw_ref = COALESCE(excluded.raw_ref, jobs.raw_ref),
+    last_seen = excluded.last_seen
+"""
+
+
+def _sql_text(v: Any) -> str | None:
+    if v is None or isinstance(v, str):
+        return v
+    return json.dumps(v)
+
+
+class _SqliteSink:
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.skipped = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SQLITE_SCHEMA)
+
+    def __call__(self, records: list[dict]) -> None:
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        rows = []
+        for r in records:
+            if not r.get("jobId"):
+                self.skipped += 1
+                continue
+            rows.append(
+                (
+                    r["jobId"],
+                    _sql_text(r.get("title")),
+                    _sql_text(r.get("company")),
+                    _sql_text(r.get("location")),
+                    r.get("jobright_url"),
+                    r.get("apply_url"),
+                    json.dumps(r.get("linkedin_recruiters") or []),
+                    json.dumps(r.get("keywords") or []),
+                    json.dumps(r["raw"]) if "raw" in r else None,
+                    r.get("raw_ref"),
+                    now,
+                    now,
+                )
+            )
+        with self._db:
+            self._db.executemany(_SQLITE_UPSERT, rows)
+        self.count += len(rows)
+
+    def close(self) -> None:
+        self._db.close()
+
+
+ENGINES: dict[str, Callable[..., list[dict]]] = {
+    "browser": fetch_recommendations_via_api,
+    "http": fetch_recommendations_via_http,
+    "async": fetch_recommendations_async,
+    "daemon": fetch_recommendations_via_daemon,
+}
 
 
 def main() -> None:
@@ -346,21 +2074,251 @@ def main() -> None:
     ap.add_argument("--login", action="store_true", help="Open browser to log in and save session state")
     ap.add_argument("--max", type=int, default=50, help="Max jobs to fetch")
     ap.add_argument("--out", default="jobright_recs.json", help="Output json file")
+    ap.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        default="json",
+        help="json: one array written at the end; ndjson: one job per line, written and flushed per API page",
+    )
+    ap.add_argument("--sqlite", metavar="PATH", help="Also upsert jobs into this SQLite database, keyed by jobId")
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip jobs seen by earlier runs and stop after --stop-after-known of them in a row",
+    )
+    ap.add_argument(
+        "--stop-after-known",
+        type=int,
+        default=10,
+        help="Consecutive already-known jobs that end an --incremental run",
+    )
+    ap.add_argument("--seen-db", default=SEEN_DB, help="SQLite file holding job IDs seen across runs")
+    ap.add_argument(
+        "--checkpoint",
+        nargs="?",
+        const=CHECKPOINT_FILE,
+        metavar="PATH",
+        help=f"Save progress after every API page (default path {CHECKPOINT_FILE}) so --resume can continue",
+    )
+    ap.add_argument("--resume", action="store_true", help="Continue from the checkpoint of an interrupted run")
+    ap.add_argument(
+        "--stream-parse",
+        action="store_true",
+        help="Decode API pages one job at a time instead of building the whole JSON tree",
+    )
+    ap.add_argument(
+        "--raw",
+        choices=RAW_MODES,
+        default="full",
+        help="full: embed the API job dict; none: drop it; projected: keep only --raw-keys; "
+        "store: write it once to --raw-store and reference it by hash",
+    )
+    ap.add_argument(
+        "--raw-keys",
+        default=",".join(RAW_PROJECTION),
+        help="Comma-separated keys kept by --raw projected",
+    )
+    ap.add_argument("--raw-store", default=RAW_STORE_DIR, help="Directory of content-addressed raw blobs")
+    ap.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write output without indentation or spaces (uses orjson when available)",
+    )
+    ap.add_argument(
+        "--json-backend",
+        choices=JSON_BACKENDS,
+        default="auto",
+        help="JSON library for parsing API pages and --compact output (auto: orjson if installed)",
+    )
+    ap.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="browser",
+        help="browser: headless Chromium (attaches to a running --daemon if there is one); http: plain HTTP "
+        "with saved cookies; async: concurrent pages without a browser (http and async fall back to browser "
+        "on 401/403); daemon: require a running --daemon",
+    )
+    ap.add_argument("--concurrency", type=int, default=4, help="Max pages in flight for --engine async")
+    ap.add_argument(
+        "--pipeline",
+        type=int,
+        default=0,
+        metavar="DEPTH",
+        help="Fetch the next page while up to DEPTH fetched pages are parsed on a worker thread "
+        "(browser/http/daemon engines; 0 disables)",
+    )
+    ap.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Browser engine: call the API straight from the context and only load the page on 401/403",
+    )
+    ap.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Abort images, fonts, stylesheets and third-party hosts while the browser loads pages",
+    )
+    ap.add_argument(
+        "--allow-host",
+        action="append",
+        default=[],
+        help="Extra host (and its subdomains) to allow with --block-resources; repeatable",
+    )
+    ap.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_FILE,
+        metavar="PATH",
+        help=f"Time each phase and write a JSON report of span counts and latencies (default {PROFILE_FILE})",
+    )
+    ap.add_argument(
+        "--metrics",
+        nargs="?",
+        const=METRICS_FILE,
+        metavar="PATH",
+        help=f"Write Prometheus/OpenMetrics text metrics for the run to PATH (default {METRICS_FILE}), e.g. "
+        "into a node_exporter textfile-collector directory; a --daemon serves them on /metrics",
+    )
+    ap.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record page requests, decoding, extraction and sink writes as Chrome trace events in PATH "
+        "(open in chrome://tracing or ui.perfetto.dev)",
+    )
+    ap.add_argument(
+        "--memprofile",
+        nargs="?",
+        const=MEMPROFILE_FILE,
+        metavar="PATH",
+        help="Trace Python allocations at stage boundaries (each page decode and extraction, after the fetch, "
+        f"around the final dump) and write top allocation sites and bytes per retained job (default {MEMPROFILE_FILE})",
+    )
+    ap.add_argument(
+        "--memprofile-every",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --memprofile, also snapshot allocation sites on every Nth page (default: first page only)",
+    )
+    ap.add_argument("--daemon", action="store_true", help="Keep a warm browser running and serve API calls locally")
+    ap.add_argument("--daemon-port", type=int, default=DAEMON_PORT, help="Local port of the warm-browser daemon")
+    ap.add_argument("--no-daemon", action="store_true", help="Never attach to a running daemon")
     args = ap.parse_args()
 
+    try:
+        set_json_backend(args.json_backend)
+    except ImportError as e:
+        print(f"[ERROR] {e}")
+        return
+
+    if args.profile:
+        PROFILER.enable()
+    if args.metrics:
+        METRICS.enable()
+    if args.trace:
+        TRACER.enable()
+    if args.memprofile:
+        MEMPROF.enable(every=args.memprofile_every)
+    started = time.time()
+    ok = False
+
     if args.login:
         save_login_state()
 
+    if args.daemon:
+        try:
+            serve_daemon(args.daemon_port, block_resources=args.block_resources, allow_hosts=tuple(args.allow_host))
+        except FileNotFoundError:
+            print(f"[ERROR] Missing {STATE_FILE}. Run: python jobright_scrape.py --login")
+        return
+
+    engine = args.engine
+    health = None
+    if engine == "daemon" or (engine == "browser" and not args.no_daemon):
+        health = _daemon_health(args.daemon_port)
+    # Only a daemon started from this session state, whose token we can read, may answer for it.
+    mismatch = None
+    if health is not None and health.get("state_file") != os.path.abspath(STATE_FILE):
+        mismatch = f"serves {health.get('state_file')}, not {STATE_FILE}"
+    elif health is not None and _read_daemon_token(args.daemon_port) is None:
+        mismatch = f"has no token at {_daemon_token_path(args.daemon_port)}"
+    if engine == "browser" and health is not None and mismatch is None:
+        print(f"[INFO] Attaching to daemon on port {args.daemon_port}")
+        engine = "daemon"
+    elif engine == "browser" and mismatch is not None:
+        print(f"[WARN] Daemon on port {args.daemon_port} {mismatch}; launching a browser instead")
+    elif engine == "daemon" and health is None:
+        print(f"[ERROR] No daemon on port {args.daemon_port}. Start one with: python jobright_scrape.py --daemon")
+        return
+    elif engine == "daemon" and mismatch is not None:
+        print(f"[ERROR] Daemon on port {args.daemon_port} {mismatch}")
+        return
+
+    kwargs: dict[str, Any] = {"raw_mode": args.raw, "stream_parse": args.stream_parse}
+    raw_store = None
+    if args.raw == "projected":
+        kwargs["raw_keys"] = tuple(k.strip() for k in args.raw_keys.split(",") if k.strip())
+    elif args.raw == "store":
+        raw_store = kwargs["raw_store"] = _RawStore(args.raw_store)
+    checkpoint = None
+    if args.checkpoint or args.resume:
+        checkpoint = kwargs["checkpoint"] = _Checkpoint(args.checkpoint or CHECKPOINT_FILE, resume=args.resume)
+    preview: list[dict] = []
+    sinks: list[PageSink] = []
+    ndjson = None
+    if args.format == "ndjson":
+        keep = checkpoint.state["emitted"] if checkpoint is not None and checkpoint.state is not None else None
+        ndjson = _NdjsonSink(args.out, compact=args.compact, keep=keep)
+        sinks += [ndjson, lambda records: preview.extend(records[: max(0, 20 - len(preview))])]
+        kwargs["collect"] = False
+    sqlite = None
+    if args.sqlite:
+        sqlite = _SqliteSink(args.sqlite)
+        sinks.append(sqlite)
+    kwargs["sinks"] = sinks
+    known = None
+    if args.incremental:
+        known = kwargs["known"] = _SeenStore(args.seen_db)
+        kwargs["stop_after_known"] = args.stop_after_known
+
+    MEMPROF.snapshot("start")
     try:
-        jobs = fetch_recommendations_via_api(max_items=args.max)
+        if engine != "async":
+            kwargs["pipeline_depth"] = args.pipeline
+        if engine == "browser":
+            kwargs["preflight"] = args.preflight
+            kwargs["block_resources"] = args.block_resources
+            kwargs["allow_hosts"] = tuple(args.allow_host)
+        elif engine == "async":
+            kwargs["concurrency"] = args.concurrency
+        elif engine == "daemon":
+            kwargs["port"] = args.daemon_port
+        jobs = ENGINES[engine](max_items=args.max, **kwargs)
+        ok = True
     except FileNotFoundError:
         print(f"[ERROR] Missing {STATE_FILE}. Run: python jobright_scrape.py --login")
         return
-    except PermissionError as e:
+    except (PermissionError, ValueError) as e:
         print(f"[ERROR] {e}")
         return
-
-    print(f"[OK] Fetched {len(jobs)} jobs")
+    finally:
+        if ndjson is not None:
+            ndjson.close()
+        if sqlite is not None:
+            sqlite.close()
+        if known is not None:
+            known.close()
+        if checkpoint is not None:
+            checkpoint.close()
+        if args.metrics:
+            METRICS.set("jobright_run_success", int(ok))
+            METRICS.set("jobright_run_duration_seconds", round(time.time() - started, 3))
+            METRICS.set("jobright_run_timestamp_seconds", int(time.time()))
+            _write_metrics(args.metrics)
+
+    MEMPROF.snapshot("fetch.done")
+    if ndjson is not None:
+        jobs = preview
+    print(f"[OK] Fetched {ndjson.count if ndjson is not None else len(jobs)} jobs")
     for j in jobs[:20]:
         print(f"- {j.get('title') or ''} | {j.get('company') or ''} | {j.get('location') or ''}")
         print(f"  jobright: {j.get('jobright_url')}")
@@ -375,10 +2333,31 @@ def main() -> None:
             print("  keywords:", ", ".join(kws[:12]))
         print()
 
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, indent=2)
+    if ndjson is None:
+        MEMPROF.snapshot("dump.before")
+        with _span("output.dump"):
+            _json_write(args.out, jobs, compact=args.compact)
+        MEMPROF.snapshot("dump.after")
 
     print(f"[OK] Wrote {args.out}")
+    print(
+        f"[INFO] JSON ({_json_backend}): decoded {JSON_STATS['decode_calls']} payloads "
+        f"({JSON_STATS['decode_bytes'] / 1e6:.1f} MB) in {JSON_STATS['decode_s'] * 1000:.0f} ms, "
+        f"encoded in {JSON_STATS['encode_s'] * 1000:.0f} ms"
+    )
+    if checkpoint is not None:
+        checkpoint.finish()
+    if sqlite is not None:
+        print(f"[OK] Upserted {sqlite.count} jobs into {args.sqlite}")
+    if raw_store is not None:
+        print(f"[OK] Raw store {raw_store.root}: {raw_store.written} new blobs, {raw_store.reused} already stored")
+    if args.profile:
+        _write_profile(args.profile)
+    if args.memprofile:
+        _write_memprofile(args.memprofile, len(jobs) if ndjson is None else 0)
+    if args.trace:
+        _json_write(args.trace, TRACER.trace(), compact=True)
+        print(f"[OK] Wrote trace {args.trace} ({len(TRACER.events)} events)")
 
 
 if __name__ == "__main__":
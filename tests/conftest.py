@@ -1,6 +1,38 @@
-import sys
+import json, pytest, sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
\ No newline at end of file
+    sys.path.insert(0, str(ROOT))
+
+import jobright_scrape as js  # noqa: E402
+from benchmarks.fake_server import FakeJobright  # noqa: E402
+
+
+_COOKIE = {"domain": "127.0.0.1", "path": "/", "expires": -1, "httpOnly": True, "secure": False, "sameSite": "Lax"}
+
+
+@pytest.fixture()
+def server(request, tmp_path, monkeypatch):
+    srv = FakeJobright(variant="minimal", status=getattr(request, "param", 200)).start()
+
+    state = tmp_path / "jobright_state.json"
+    state.write_text(
+        json.dumps(
+            {
+                "cookies": [
+                    dict(_COOKIE, name="sid", value="abc"),
+                    dict(_COOKIE, name="other", value="x", domain=".example.com"),
+                    dict(_COOKIE, name="old", value="y", expires=1),
+                ],
+                "origins": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(js, "STATE_FILE", str(state))
+    srv.patch(monkeypatch, js)
+    yield srv
+    srv.stop()
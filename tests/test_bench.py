@@ -0,0 +1,45 @@
+from benchmarks import bench
+
+
+def _report(jobs_per_sec, peak):
+    return {"results": {"extract_keywords": {"jobs_per_sec": jobs_per_sec, "peak_bytes_per_job": peak}}}
+
+
+def test_compare_flags_throughput_drops_and_memory_growth_beyond_thresholds():
+    base = _report(1000.0, 200.0)
+
+    assert bench.compare(_report(900.0, 230.0), base, threshold=0.15, mem_threshold=0.2) == []
+    assert bench.compare(_report(5000.0, 10.0), base, threshold=0.15, mem_threshold=0.2) == []
+
+    slow = bench.compare(_report(800.0, 200.0), base, threshold=0.15, mem_threshold=0.2)
+    assert slow == ["extract_keywords jobs_per_sec -20.0% (limit 15%)"]
+
+    fat = bench.compare(_report(1000.0, 260.0), base, threshold=0.15, mem_threshold=0.2)
+    assert fat == ["extract_keywords peak_bytes_per_job +30.0% (limit 20%)"]
+
+
+def test_compare_ignores_cases_missing_from_the_baseline():
+    current = {"results": {"fetch async": {"jobs_per_sec": 1.0}}}
+    assert bench.compare(current, _report(1000.0, 200.0), threshold=0.15, mem_threshold=0.2) == []
+
+
+def test_compare_widens_the_throughput_limit_to_the_baseline_spread():
+    base = _report(1000.0, 200.0)
+    base["results"]["extract_keywords"]["jobs_per_sec_spread"] = 0.3
+
+    assert bench.compare(_report(800.0, 200.0), base, threshold=0.15, mem_threshold=0.2) == []
+    slow = bench.compare(_report(600.0, 200.0), base, threshold=0.15, mem_threshold=0.2)
+    assert slow == ["extract_keywords jobs_per_sec -40.0% (limit 30%)"]
+
+    base["results"]["extract_keywords"]["jobs_per_sec_spread"] = 0.05
+    assert bench.compare(_report(800.0, 200.0), base, threshold=0.15, mem_threshold=0.2)
+
+
+def test_compare_caps_the_widening_and_noisy_reports_are_named():
+    base = _report(1000.0, 200.0)
+    base["results"]["extract_keywords"]["jobs_per_sec_spread"] = 0.9
+
+    slow = bench.compare(_report(650.0, 200.0), base, threshold=0.15, mem_threshold=0.2)
+    assert slow == ["extract_keywords jobs_per_sec -35.0% (limit 30%)"]
+    assert bench.noisy(base, 0.15) == ["extract_keywords"]
+    assert bench.noisy(_report(1000.0, 200.0), 0.15) == []
@@ -0,0 +1,152 @@
+import jobright_scrape as js
+from playwright.sync_api import TimeoutError as PWTimeoutError
+
+
+class _Resp:
+    def __init__(self, url: str, ok: bool = True):
+        self.url = url
+        self.ok = ok
+
+
+class _Page:
+    def __init__(self, during_goto=(), later=None):
+        self.during_goto = list(during_goto)
+        self.later = later
+        self.listeners = []
+        self.waited = []
+
+    def on(self, event, fn):
+        self.listeners.append(fn)
+
+    def remove_listener(self, event, fn):
+        self.listeners.remove(fn)
+
+    def goto(self, url, **kw):
+        for r in self.during_goto:
+            for fn in list(self.listeners):
+                fn(r)
+
+    def wait_for_event(self, event, predicate, timeout):
+        self.waited.append(timeout)
+        if self.later is not None and predicate(self.later):
+            return self.later
+        raise PWTimeoutError("timeout")
+
+
+def test_open_recs_page_skips_wait_when_recs_xhr_already_seen(monkeypatch):
+    monkeypatch.setattr(js, "READY_WAITS", [])
+    page = _Page(during_goto=[_Resp(js.RECS_API + "?position=0")])
+
+    js._open_recs_page(page, 1500, "warm-up")
+
+    assert page.waited == []
+    assert page.listeners == []
+    assert js.READY_WAITS[0]["ready"] is True
+
+
+def test_open_recs_page_waits_up_to_ceiling_for_recs_xhr(monkeypatch):
+    monkeypatch.setattr(js, "READY_WAITS", [])
+
+    ready = _Page(later=_Resp(js.RECS_API))
+    js._open_recs_page(ready, 1500, "warm-up")
+
+    never = _Page(during_goto=[_Resp(js.RECS_API, ok=False), _Resp(js.BASE + "/other")])
+    js._open_recs_page(never, 1200, "auth retry")
+
+    assert ready.waited == [1500]
+    assert never.waited == [1200]
+    assert [w["ready"] for w in js.READY_WAITS] == [True, False]
+    assert [w["label"] for w in js.READY_WAITS] == ["warm-up", "auth retry"]
+
+
+class _ApiResp:
+    def __init__(self, status: int):
+        self.status = status
+
+    def body(self):
+        return b"{}"
+
+
+class _Request:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def get(self, url, headers=None):
+        self.calls += 1
+        return _ApiResp(self.statuses.pop(0))
+
+
+class _Context:
+    def __init__(self, statuses):
+        self.request = _Request(statuses)
+        self.pages = []
+
+    def new_page(self):
+        page = _Page()
+        page.request = _Request([200] * 5)
+        self.pages.append(page)
+        return page
+
+
+def test_preflight_uses_context_request_without_a_page(monkeypatch):
+    monkeypatch.setattr(js, "READY_WAITS", [])
+    context = _Context([200, 200])
+
+    get = js._make_browser_get(context, preflight=True)
+
+    assert get(js.RECS_API + "?position=0")[0] == 200
+    assert get(js.RECS_API + "?position=10")[0] == 200
+    assert context.pages == []
+    assert js.READY_WAITS == []
+
+
+def test_preflight_falls_back_to_page_navigation_on_auth_failure(monkeypatch):
+    monkeypatch.setattr(js, "READY_WAITS", [])
+    context = _Context([403])
+
+    get = js._make_browser_get(context, preflight=True)
+
+    assert get(js.RECS_API + "?position=0")[0] == 200
+    assert get(js.RECS_API + "?position=10")[0] == 200
+    assert len(context.pages) == 1
+    assert context.request.calls == 1
+    assert context.pages[0].request.calls == 2
+    assert [w["label"] for w in js.READY_WAITS] == ["preflight fallback"]
+
+
+class _Route:
+    def __init__(self, url: str, resource_type: str):
+        self.request = type("Req", (), {"url": url, "resource_type": resource_type})()
+        self.outcome = None
+
+    def abort(self):
+        self.outcome = "abort"
+
+    def continue_(self):
+        self.outcome = "continue"
+
+
+def test_resource_blocking_aborts_assets_and_third_party_hosts(monkeypatch):
+    monkeypatch.setattr(js, "BASE", "https://jobright.ai")
+    routes = {}
+    context = type("Ctx", (), {"route": lambda self, pattern, fn: routes.setdefault(pattern, fn)})()
+
+    counts = js._install_resource_blocking(context, allow_hosts=("cdn.example.com",))
+    handle = routes["**/*"]
+
+    cases = [
+        ("https://jobright.ai/jobs/recommend", "document", "continue"),
+        ("https://api.jobright.ai/swan/x", "xhr", "continue"),
+        ("https://jobright.ai/_next/app.js", "script", "continue"),
+        ("https://jobright.ai/logo.png", "image", "abort"),
+        ("https://jobright.ai/font.woff2", "font", "abort"),
+        ("https://www.google-analytics.com/collect", "xhr", "abort"),
+        ("https://cdn.example.com/bundle.js", "script", "continue"),
+    ]
+    for url, rtype, expected in cases:
+        route = _Route(url, rtype)
+        handle(route)
+        assert route.outcome == expected, url
+
+    assert counts == {"allowed": 4, "blocked": 3}
@@ -1,4 +1,6 @@
+import json, pytest, random, sys
 import jobright_scrape as js
+from benchmarks.payloads import COMPANIES, make_payload
 
 
 def test_extract_job_dicts_filters_profiles():
@@ -46,4 +48,155 @@ def test_extract_keywords_dedupes_and_caps():
     }
     kws = js.extract_keywords(job, max_kw=5)
     assert len(kws) == 5
-    assert len(set(kws)) == 5
\ No newline at end of file
+    assert len(set(kws)) == 5
+
+def test_normalize_job_raw_modes(tmp_path):
+    job = {"jobInfoId": 7, "jobTitle": "SWE", "companyName": "Acme", "jobSummary": "Acme is hiring.", "big": "x" * 100}
+
+    assert js._normalize_job(job, "7")["raw"] is job
+    assert "raw" not in js._normalize_job(job, "7", raw_mode="none")
+    assert js._normalize_job(job, "7", raw_mode="projected")["raw"] == {"jobSummary": "Acme is hiring."}
+
+    store = js._RawStore(str(tmp_path / "raw"))
+    first = js._normalize_job(job, "7", raw_mode="store", raw_store=store)
+    again = js._normalize_job(dict(reversed(list(job.items()))), "7", raw_mode="store", raw_store=store)
+
+    assert "raw" not in first
+    assert first["raw_ref"] == again["raw_ref"]
+    assert first["raw_ref"].startswith("sha256:")
+    assert (store.written, store.reused) == (1, 1)
+    assert store.get(first["raw_ref"]) == job
+
+
+def test_field_extractor_matches_pick_order():
+    rng = random.Random(7)
+    for _ in range(500):
+        job = {}
+        for keys in js.JOB_FIELDS.values():
+            for k in keys:
+                roll = rng.random()
+                if roll < 0.3:
+                    job[k] = f"{k}-value"
+                elif roll < 0.45:
+                    job[k] = None
+        job = dict(rng.sample(list(job.items()), len(job)))
+
+        fields = js._extract_fields(job)
+        for field, keys in js.JOB_FIELDS.items():
+            assert fields[field] == js._pick(job, *keys), (field, job)
+
+    assert js._extract_fields({}) == dict.fromkeys(js.JOB_FIELDS)
+
+
+def test_normalize_job_company_precedence():
+    assert js._normalize_job({"companyName": {"name": "Acme"}}, None)["company"] == "Acme"
+    assert js._normalize_job({"companyName": None, "jdCompanyName": " Beta "}, None)["company"] == "Beta"
+    assert js._normalize_job({"companyName": "", "companyInfo": {"name": "Gamma"}}, None)["company"] == "Gamma"
+    assert js.extract_company({"company": {"companyName": "Delta"}, "jdCompanyName": "Other"}) == "Delta"
+
+
+def test_extract_job_dicts_learns_job_path_and_falls_back_on_shape_change():
+    def payload(*ids, wrapper="data"):
+        jobs = [{"jobInfoId": i, "jobTitle": "SWE", "companyName": "Acme", "socialConnections": []} for i in ids]
+        return {wrapper: {"jobs": jobs, "total": 100}, "success": True}
+
+    shape = js._JobShape()
+    assert [j["jobInfoId"] for j in js._extract_job_dicts(payload(1, 2), shape)] == [1, 2]
+    assert shape.path == ("data", "jobs")
+
+    assert [j["jobInfoId"] for j in js._extract_job_dicts(payload(3, 4), shape)] == [3, 4]
+    assert (shape.hits, shape.misses) == (1, 1)
+
+    assert [j["jobInfoId"] for j in js._extract_job_dicts(payload(5, wrapper="result"), shape)] == [5]
+    assert (shape.hits, shape.misses) == (1, 2)
+    assert shape.path == ("result", "jobs")
+
+
+def test_is_job_memoizes_by_key_set():
+    js._IS_JOB_CACHE.clear()
+    assert js._is_job({"jobId": 1, "title": "x", "applyUrl": "u"}) is True
+    assert js._is_job({"applyUrl": "v", "title": "y", "jobId": 2}) is True
+    assert js._is_job({"jobId": 1, "title": "x", "fullName": "p", "company": "c"}) is False
+    assert len(js._IS_JOB_CACHE) == 2
+
+
+def test_extract_job_dicts_handles_deep_payloads_and_budgets(capsys):
+    job = {"jobInfoId": 1, "jobTitle": "SWE", "companyName": "Acme"}
+    root = node = {}
+    for _ in range(sys.getrecursionlimit() + 50):
+        node["next"] = {}
+        node = node["next"]
+    node["jobs"] = [job]
+
+    assert js._extract_job_dicts(root, max_depth=sys.getrecursionlimit() + 100) == [job]
+    assert js._extract_job_dicts(root, max_depth=10) == []
+    assert "deeper than 10" in capsys.readouterr().out
+
+    wide = {"jobs": [dict(job, jobInfoId=i) for i in range(50)]}
+    assert len(js._extract_job_dicts(wide, max_nodes=11)) == 9
+    assert "stopped after 11 nodes" in capsys.readouterr().out
+
+
+def test_extract_job_dicts_only_warns_when_depth_limit_skips_containers(capsys):
+    job = {"jobInfoId": 1, "jobTitle": "SWE", "companyName": "Acme"}
+
+    assert js._extract_job_dicts({"a": {"jobs": [job]}}, max_depth=4) == [job]
+    assert "deeper than" not in capsys.readouterr().out
+
+    assert js._extract_job_dicts({"a": {"jobs": [dict(job, tags=["x"])]}}, max_depth=4) == [dict(job, tags=["x"])]
+    assert "deeper than" in capsys.readouterr().out
+
+
+def test_extract_job_dicts_counts_only_visited_nodes():
+    job = {"jobInfoId": 1, "jobTitle": "SWE", "companyName": "Acme", "socialConnections": [{"a": {}}, {"b": {}}]}
+    before = js.WALK_STATS["nodes"]
+
+    js._extract_job_dicts({"jobs": [job]})
+    assert js.WALK_STATS["nodes"] - before == 3
+    js._extract_job_dicts({"jobs": [job]}, prune=frozenset())
+    assert js.WALK_STATS["nodes"] - before == 3 + 8
+
+
+def test_extract_job_dicts_prunes_known_non_job_subtrees():
+    nested = {"jobInfoId": 2, "jobTitle": "Nested", "companyName": "Acme"}
+    job = {"jobInfoId": 1, "jobTitle": "SWE", "companyName": "Acme", "socialConnections": [{"x": nested}]}
+
+    assert js._extract_job_dicts({"jobs": [job]}) == [job]
+    assert js._extract_job_dicts({"jobs": [job]}, prune=frozenset()) == [job, nested]
+
+
+def test_stream_parser_matches_full_parse_across_chunk_boundaries():
+    jobs = [
+        {
+            "jobInfoId": f"job-{i}",
+            "jobTitle": 'Eng "II" [backend] {core}',
+            "companyName": "Café ☃ Co\\\\",
+            "applyUrl": "/apply",
+            "socialConnections": [{"fullName": "R", "jobTitle": "Recruiter", "linkedinUrl": "x"}],
+            "tags": ["a]", "{b", "\\"],
+        }
+        for i in range(4)
+    ]
+    payload = {"success": True, "msg": "ok ] }", "result": {"jobs": jobs, "meta": [{"firstName": "me"}, [1, 2]]}}
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    for size in (1, 2, 3, 7, 64, len(body)):
+        got = list(js._iter_job_dicts_stream(js._byte_chunks(body, size)))
+        assert got == js._extract_job_dicts(payload), size
+
+    with pytest.raises(ValueError):
+        list(js._iter_job_dicts_stream([body[:-20]]))
+
+
+def test_synthetic_payloads_extract_every_job_and_no_decoys():
+    for nesting in (1, 4):
+        payload = make_payload(24, seed=3, nesting=nesting, decoys=5)
+        jobs = js._extract_job_dicts(payload)
+
+        assert [j["jobInfoId"] for j in jobs] == [f"job-{i}" for i in range(24)]
+        companies = {js.extract_company(j) for j in jobs}
+        assert companies <= set(COMPANIES) | {c.lower().replace(" ", "") for c in COMPANIES}
+        assert all(js.extract_keywords(j) for j in jobs)
+
+    assert make_payload(5, seed=1) == make_payload(5, seed=1)
+    assert make_payload(5, seed=1) != make_payload(5, seed=2)
@@ -0,0 +1,58 @@
+import pytest
+import jobright_scrape as js
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+from benchmarks.fake_server import FakeJobright, lognormal
+
+
+@pytest.mark.parametrize("envelope", ["data.jobs", "data", "result.jobList", "nested"])
+def test_fake_server_shapes_extract_through_http_engine(server, envelope):
+    server.envelope = envelope
+    server.variant = "realistic"
+    server.overlap = 1
+
+    jobs = js.fetch_recommendations_via_http(max_items=12, page_size=5)
+
+    assert [j["jobId"] for j in jobs] == [f"job-{i}" for i in range(12)]
+    assert all(j["company"] and j["keywords"] for j in jobs)
+
+
+def test_fake_server_total_and_injected_failures(server, monkeypatch):
+    server.total = 8
+    assert len(js.fetch_recommendations_via_http(max_items=50, page_size=3)) == 8
+
+    server.total, server.script, server.api_calls = None, {2: 503}, 0
+    assert len(js.fetch_recommendations_via_http(max_items=50, page_size=3)) == 3
+    assert server.statuses[503] == 1
+
+    fallbacks = []
+    monkeypatch.setattr(js, "fetch_recommendations_via_api", lambda *a, **kw: fallbacks.append(kw) or [])
+    server.script, server.api_calls, server.unauthorized_every = {}, 0, 2
+    js.fetch_recommendations_via_http(max_items=50, page_size=3)
+    assert server.statuses[401] == 1 and len(fallbacks) == 1
+
+
+def test_fake_server_error_rates_and_latency_are_seeded():
+    def statuses(seed):
+        srv = FakeJobright(errors={429: 0.2, 500: 0.1}, latency=lognormal(0.001, 0.5), seed=seed)
+        return [srv._api_status() for _ in range(200)]
+
+    first = statuses(5)
+    assert first == statuses(5)
+    codes = [code for code, _, _ in first]
+    assert 20 < codes.count(429) < 60 and 5 < codes.count(500) < 40
+    assert all(delay > 0 for _, delay, _ in first)
+    assert [n for _, _, n in first] == list(range(1, 201))
+
+
+def test_fake_server_rotates_a_distinct_session_per_concurrent_call():
+    with FakeJobright(rotate_session=True, latency=0.01) as srv:
+
+        def call(_):
+            with urlopen(f"{srv.api_url}?position=0&count=1") as resp:
+                return resp.headers["Set-Cookie"].split(";")[0]
+
+        with ThreadPoolExecutor(8) as pool:
+            cookies = list(pool.map(call, range(24)))
+
+    assert sorted(cookies) == sorted(f"sid=rot-{n}" for n in range(1, 25))
@@ -0,0 +1,291 @@
+import asyncio, json, os, pytest, random, sqlite3, threading
+import jobright_scrape as js
+from urllib.parse import parse_qs, urlparse
+
+
+def test_http_engine_paginates_with_saved_cookies_on_one_connection(server):
+    jobs = js.fetch_recommendations_via_http(max_items=7, page_size=3)
+
+    assert [j["jobId"] for j in jobs] == [f"job-{i}" for i in range(7)]
+    assert jobs[0]["apply_url"] == f"{server.base_url}/apply/0"
+    assert server.cookies == ["sid=abc"] * 3
+    assert len(server.ports) == 1
+
+
+@pytest.mark.parametrize("server", [403], indirect=True)
+def test_http_engine_falls_back_to_browser_on_auth_failure(server, monkeypatch):
+    calls = []
+    monkeypatch.setattr(js, "fetch_recommendations_via_api", lambda *a, **kw: calls.append(kw) or ["fallback"])
+
+    assert js.fetch_recommendations_via_http(max_items=2, page_size=2) == ["fallback"]
+    assert len(calls) == 1
+    pager = calls[0].pop("pager")
+    assert calls == [{"sort_condition": 0, "page_size": 2, "pipeline_depth": 0}]
+    assert (pager.position, pager.emitted, pager.done) == (0, 0, False)
+
+
+def _browser_stand_in(server):
+    # Plays the browser engine after a fallback: same server, fresh session, continues the pager it is handed.
+    def fetch(max_items, sort_condition=0, page_size=10, pipeline_depth=0, pager=None, **kw):
+        server.unauthorized_every = 0
+        client = js._HttpClient({})
+        try:
+            return js._paginate(client.get, max_items, sort_condition, page_size, pipeline_depth, pager, **kw)
+        finally:
+            client.close()
+
+    return fetch
+
+
+@pytest.mark.parametrize("engine", ["http", "async"])
+def test_auth_fallback_continues_without_rewriting_streamed_pages(server, monkeypatch, tmp_path, engine):
+    if engine == "async":
+        pytest.importorskip("playwright.async_api")
+    server.unauthorized_every = 3
+    monkeypatch.setattr(js, "fetch_recommendations_via_api", _browser_stand_in(server))
+    out = tmp_path / "recs.ndjson"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", engine, "--max", "40", "--format", "ndjson", "--out", str(out)],
+    )
+
+    js.main()
+
+    ids = [json.loads(line)["jobId"] for line in out.read_text(encoding="utf-8").splitlines()]
+    assert server.statuses[401] == 1
+    assert ids == [f"job-{i}" for i in range(40)]
+
+
+def test_auth_fallback_keeps_incremental_runs_from_stopping_on_their_own_pages(server, monkeypatch, tmp_path):
+    server.unauthorized_every = 3
+    monkeypatch.setattr(js, "fetch_recommendations_via_api", _browser_stand_in(server))
+    out, db = tmp_path / "o.json", tmp_path / "j.db"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "http", "--incremental", "--max", "40"]
+        + ["--sqlite", str(db), "--out", str(out)],
+    )
+
+    js.main()
+
+    jobs = json.loads(out.read_text(encoding="utf-8"))
+    assert [j["jobId"] for j in jobs] == [f"job-{i}" for i in range(40)]
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 40
+
+
+def test_pipelined_pagination_matches_serial_and_overlaps_extraction(monkeypatch):
+    threads = set()
+    real_extract = js._extract_job_dicts
+
+    def extract(data, *args):
+        threads.add(threading.current_thread().name)
+        return real_extract(data, *args)
+
+    monkeypatch.setattr(js, "_extract_job_dicts", extract)
+
+    def get(url):
+        qs = parse_qs(urlparse(url).query)
+        position, count = int(qs["position"][0]), int(qs["count"][0])
+        jobs = [
+            {"jobInfoId": f"job-{max(position - 1, 0) + i}", "jobTitle": "SWE", "companyName": "Acme"}
+            for i in range(count)
+        ]
+        return 200, json.dumps({"data": {"jobs": jobs}}).encode("utf-8")
+
+    serial = js._paginate(get, max_items=23, sort_condition=0, page_size=4)
+    piped = js._paginate(get, max_items=23, sort_condition=0, page_size=4, pipeline_depth=2)
+
+    assert [j["jobId"] for j in piped] == [j["jobId"] for j in serial]
+    assert len(piped) == 23
+    assert "jobright-extract" in threads
+
+
+def test_pipelined_pagination_raises_auth_errors_on_caller_thread():
+    with pytest.raises(PermissionError):
+        js._paginate(lambda url: (403, b""), max_items=5, sort_condition=0, page_size=2, pipeline_depth=2)
+
+
+def test_paginate_async_reassembles_pages_in_position_order():
+    in_flight = []
+    peak = []
+
+    async def get(url):
+        qs = parse_qs(urlparse(url).query)
+        position, count = int(qs["position"][0]), int(qs["count"][0])
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        await asyncio.sleep(random.random() / 100)
+        in_flight.remove(url)
+        # Every page repeats the previous page's last job to exercise dedupe.
+        jobs = [
+            {"jobInfoId": f"job-{max(position - 1, 0) + i}", "jobTitle": "SWE", "companyName": "Acme"}
+            for i in range(count)
+        ]
+        return 200, json.dumps({"data": {"jobs": jobs}}).encode("utf-8")
+
+    jobs = asyncio.run(js._paginate_async(get, max_items=40, sort_condition=0, page_size=5, concurrency=3))
+
+    ids = [j["jobId"] for j in jobs]
+    assert len(ids) == 40
+    assert len(set(ids)) == 40
+    assert ids == sorted(ids, key=lambda x: int(x.split("-")[1]))
+    assert max(peak) <= 3
+
+
+def test_async_engine_fetches_without_a_browser(server):
+    pytest.importorskip("playwright.async_api")
+
+    jobs = js.fetch_recommendations_async(max_items=9, page_size=2, concurrency=3)
+
+    assert [j["jobId"] for j in jobs] == [f"job-{i}" for i in range(9)]
+    assert set(server.cookies) == {"sid=abc"}
+
+
+def test_async_engine_writes_rotated_session_cookies_back_to_state(server):
+    pytest.importorskip("playwright.async_api")
+    server.rotate_session = True
+
+    js.fetch_recommendations_async(max_items=6, page_size=2, concurrency=1)
+
+    assert server.cookies == ["sid=abc", "sid=rot-1", "sid=rot-2"]
+    state = json.loads(open(js.STATE_FILE, encoding="utf-8").read())
+    assert [c["value"] for c in state["cookies"] if c["name"] == "sid"] == ["rot-3"]
+    assert {c["name"]: c["value"] for c in state["cookies"]}["other"] == "x"
+    assert js._state_cookies(js.STATE_FILE, js.RECS_API)["sid"] == "rot-3"
+
+
+def test_daemon_engine_routes_api_calls_through_the_daemon(server, monkeypatch):
+    port = int(server.base_url.rsplit(":", 1)[1])
+    token = js._write_daemon_token(port)
+
+    jobs = js.fetch_recommendations_via_daemon(max_items=4, page_size=2, port=port)
+
+    assert [j["jobId"] for j in jobs] == [f"job-{i}" for i in range(4)]
+    assert server.proxied
+    assert set(server.authorizations) == {f"Bearer {token}"}
+    assert js._daemon_health(port)["ok"] is True
+    server.stop()
+    assert js._daemon_health(port) is None
+
+
+def test_daemon_rejects_foreign_hosts_origins_and_missing_tokens():
+    ok = {"host": "127.0.0.1:8765", "authorization": "Bearer t0k"}
+
+    assert js._daemon_reject(ok, 8765, "t0k", need_token=True) is None
+    assert js._daemon_reject(dict(ok, host="localhost:8765"), 8765, "t0k", need_token=True) is None
+    assert js._daemon_reject(dict(ok, host="evil.example:8765"), 8765, "t0k", need_token=True)
+    assert js._daemon_reject(dict(ok, origin="https://evil.example"), 8765, "t0k", need_token=True)
+    assert js._daemon_reject(dict(ok, authorization="Bearer nope"), 8765, "t0k", need_token=True)
+    assert js._daemon_reject({"host": "127.0.0.1:8765"}, 8765, "t0k", need_token=True)
+    assert js._daemon_reject({"host": "127.0.0.1:8765"}, 8765, "t0k", need_token=False) is None
+
+
+def test_main_attaches_only_to_a_daemon_serving_the_same_state(server, monkeypatch, tmp_path, capsys):
+    port = server.base_url.rsplit(":", 1)[1]
+    js._write_daemon_token(int(port))
+    out = tmp_path / "recs.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "daemon", "--daemon-port", port, "--max", "2", "--out", str(out)],
+    )
+
+    server.daemon_state = str(tmp_path / "someone_else.json")
+    js.main()
+    assert "serves" in capsys.readouterr().out
+    assert not server.proxied and not out.exists()
+
+    server.daemon_state = os.path.abspath(js.STATE_FILE)
+    js.main()
+    assert server.proxied and len(json.loads(out.read_text(encoding="utf-8"))) == 2
+
+
+def test_main_streams_ndjson_one_job_per_line(server, monkeypatch, tmp_path):
+    out = tmp_path / "recs.ndjson"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "http", "--max", "5", "--format", "ndjson", "--out", str(out)],
+    )
+
+    js.main()
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["jobId"] for line in lines] == [f"job-{i}" for i in range(5)]
+
+
+def test_resume_without_a_checkpoint_rewrites_ndjson_output(server, monkeypatch, tmp_path):
+    out = tmp_path / "recs.ndjson"
+    argv = ["jobright_scrape.py", "--engine", "http", "--max", "5", "--format", "ndjson", "--out", str(out)]
+    monkeypatch.setattr("sys.argv", argv + ["--checkpoint"])
+    js.main()
+    monkeypatch.setattr("sys.argv", argv + ["--resume"])
+    js.main()
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["jobId"] for line in lines] == [f"job-{i}" for i in range(5)]
+
+
+def test_resume_refuses_a_checkpoint_saved_with_another_output_mode(server, monkeypatch, tmp_path, capsys):
+    server.script = {2: 500}
+    argv = ["jobright_scrape.py", "--engine", "http", "--max", "20", "--checkpoint"]
+    monkeypatch.setattr("sys.argv", argv + ["--format", "ndjson", "--out", str(tmp_path / "recs.ndjson")])
+    js.main()
+    saved = (tmp_path / js.CHECKPOINT_FILE).read_text(encoding="utf-8")
+
+    out = tmp_path / "recs.json"
+    monkeypatch.setattr("sys.argv", argv + ["--resume", "--out", str(out)])
+    js.main()
+
+    assert "collect=False (now True)" in capsys.readouterr().out
+    assert not out.exists()
+    assert (tmp_path / js.CHECKPOINT_FILE).read_text(encoding="utf-8") == saved
+
+
+def test_resume_after_a_crash_before_the_checkpoint_save_writes_each_job_once(server, monkeypatch, tmp_path):
+    out = tmp_path / "recs.ndjson"
+    argv = ["jobright_scrape.py", "--engine", "http", "--max", "30", "--format", "ndjson", "--out", str(out)]
+    real_save = js._Checkpoint.save
+
+    def save(self, pg, records):
+        if pg.position == 20:
+            raise RuntimeError("killed")
+        real_save(self, pg, records)
+
+    monkeypatch.setattr(js._Checkpoint, "save", save)
+    monkeypatch.setattr("sys.argv", argv + ["--checkpoint"])
+    with pytest.raises(RuntimeError):
+        js.main()
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 20
+
+    monkeypatch.setattr(js._Checkpoint, "save", real_save)
+    monkeypatch.setattr("sys.argv", argv + ["--resume"])
+    js.main()
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["jobId"] for line in lines] == [f"job-{i}" for i in range(30)]
+
+
+def test_pagination_sinks_receive_each_page_without_collecting():
+    pages = []
+    pg = js._Pagination(max_items=3, sort_condition=0, page_size=2, sinks=[pages.append], collect=False)
+    body = json.dumps({"data": [{"jobInfoId": i, "jobTitle": "SWE", "companyName": "Acme"} for i in range(2)]})
+
+    pg.consume("u", 2, 200, body.encode("utf-8"))
+    assert [[r["jobId"] for r in p] for p in pages] == [["0", "1"]]
+    assert pg.out == []
+    assert pg.remaining == 1
+
+
+def test_http_engine_writes_rotated_session_cookies_back_to_state(server):
+    server.rotate_session = True
+
+    js.fetch_recommendations_via_http(max_items=6, page_size=3)
+
+    assert server.cookies == ["sid=abc", "sid=rot-1"]
+    state = json.loads(open(js.STATE_FILE, encoding="utf-8").read())
+    by_name = {c["name"]: c for c in state["cookies"]}
+    assert by_name["sid"]["value"] == "rot-2"
+    assert by_name["sid"]["httpOnly"] and by_name["sid"]["expires"] > 0
+    assert by_name["other"]["value"] == "x"
+    assert [c["name"] for c in state["cookies"]].count("sid") == 1
+    assert js._state_cookies(js.STATE_FILE, js.RECS_API)["sid"] == "rot-2"
@@ -0,0 +1,150 @@
+import asyncio, json, tracemalloc
+import jobright_scrape as js
+from urllib.parse import parse_qs, urlparse
+
+
+def test_main_profile_reports_span_percentiles(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(js, "PROFILER", js._Profiler())
+    out, report = tmp_path / "recs.json", tmp_path / "profile.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "http", "--max", "5", "--out", str(out), "--profile", str(report)],
+    )
+
+    js.main()
+
+    spans = json.loads(report.read_text(encoding="utf-8"))["spans"]
+    assert spans["api.request"]["count"] == 1
+    assert spans["extract.fields"]["count"] == 5
+    assert spans["output.dump"]["count"] == 1
+    for s in spans.values():
+        assert 0 <= s["p50_ms"] <= s["p95_ms"] <= s["max_ms"] <= s["total_ms"]
+    assert js._percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert js._percentile([1.0, 2.0, 3.0, 4.0], 95) == 4.0
+
+
+def test_main_writes_prometheus_textfile_metrics(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(js, "METRICS", js._Metrics())
+    out, prom = tmp_path / "recs.json", tmp_path / "jobright.prom"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "http", "--max", "5", "--out", str(out), "--metrics", str(prom)],
+    )
+
+    js.main()
+
+    samples = {}
+    for line in prom.read_text(encoding="utf-8").splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    assert samples['jobright_http_responses_total{code="200"}'] == 1
+    assert samples["jobright_pages_fetched_total"] == 1
+    assert samples["jobright_jobs_emitted_total"] == 5
+    assert samples['jobright_phase_duration_seconds_count{phase="api.request"}'] == 1
+    assert samples['jobright_phase_duration_seconds_bucket{phase="api.request",le="+Inf"}'] == 1
+    assert samples["jobright_run_success"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_metrics_count_duplicates_and_status_codes(monkeypatch):
+    monkeypatch.setattr(js, "METRICS", js._Metrics())
+    js.METRICS.enable()
+    pg = js._Pagination(max_items=10, sort_condition=0, page_size=3)
+    body = json.dumps({"data": [{"jobInfoId": i, "jobTitle": "SWE", "companyName": "Acme"} for i in (1, 1, 2)]})
+
+    pg.consume("u", 3, 200, body.encode("utf-8"))
+    pg.consume("u", 3, 500, b"{}")
+
+    text = js.METRICS.render()
+    assert "jobright_duplicates_skipped_total 1\n" in text
+    assert "jobright_jobs_emitted_total 2\n" in text
+    assert 'jobright_http_responses_total{code="500"} 1\n' in text
+
+
+def test_main_writes_chrome_trace_events(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(js, "TRACER", js._Tracer())
+    out, trace = tmp_path / "recs.json", tmp_path / "trace.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "http", "--max", "5", "--out", str(out), "--trace", str(trace)],
+    )
+
+    js.main()
+
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    names = [e["name"] for e in spans]
+    assert {"api.request", "json.decode", "extract.batch", "output.dump"} <= set(names)
+    assert "extract.fields" not in names
+    assert all(e["dur"] >= 0 and {"ts", "pid", "tid"} <= e.keys() for e in spans)
+    assert names.index("api.request") < names.index("json.decode") < names.index("output.dump")
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+
+def test_async_requests_trace_as_overlapping_async_pairs(monkeypatch):
+    monkeypatch.setattr(js, "TRACER", js._Tracer())
+    js.TRACER.enable()
+
+    async def get(url):
+        await asyncio.sleep(0.01)
+        position = int(parse_qs(urlparse(url).query)["position"][0])
+        jobs = [{"jobInfoId": f"job-{position + i}", "jobTitle": "SWE", "companyName": "Acme"} for i in range(2)]
+        return 200, json.dumps({"data": {"jobs": jobs}}).encode("utf-8")
+
+    asyncio.run(js._paginate_async(get, max_items=8, sort_condition=0, page_size=2, concurrency=3))
+
+    requests = [e for e in js.TRACER.events if e["name"] == "api.request"]
+    begins = {e["id"]: e["ts"] for e in requests if e["ph"] == "b"}
+    ends = {e["id"]: e["ts"] for e in requests if e["ph"] == "e"}
+    assert begins.keys() == ends.keys() and len(begins) >= 4
+    assert all(begins[i] <= ends[i] for i in begins)
+
+
+def test_main_memprofile_reports_stages_sites_and_bytes_per_job(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(js, "MEMPROF", js._MemProfiler())
+    server.variant = "realistic"
+    out, report_path = tmp_path / "recs.json", tmp_path / "mem.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["jobright_scrape.py", "--engine", "http", "--max", "25", "--out", str(out), "--memprofile", str(report_path)],
+    )
+
+    js.main()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stages = [s["stage"] for s in report["stages"]]
+    assert stages.count("page.decode") == stages.count("page.extract") == 2
+    assert stages[0] == "start" and stages[-2:] == ["dump.before", "dump.after"]
+    transitions = {(t["from"], t["to"]): t for t in report["transitions"]}
+    assert list(transitions) == [
+        ("start", "page.decode#1"),
+        ("page.decode#1", "page.extract#1"),
+        ("page.extract#1", "fetch.done"),
+        ("fetch.done", "dump.before"),
+        ("dump.before", "dump.after"),
+    ]
+    decode_sites = [s["site"] for s in transitions[("start", "page.decode#1")]["top_sites"]]
+    assert any(site.startswith(js.__file__) for site in decode_sites)
+    assert transitions[("page.decode#1", "page.extract#1")]["top_sites"][0]["site"]
+    assert report["retained_jobs"] == 25
+    assert report["bytes_per_retained_job"] > 1000
+    assert not tracemalloc.is_tracing()
+
+
+def test_memprofile_every_nth_page_and_stream_parse_decode_boundary(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(js, "MEMPROF", js._MemProfiler())
+    out, report_path = tmp_path / "recs.ndjson", tmp_path / "mem.json"
+    argv = ["--engine", "http", "--max", "40", "--format", "ndjson", "--out", str(out), "--stream-parse"]
+    argv += ["--memprofile", str(report_path), "--memprofile-every", "2"]
+    monkeypatch.setattr("sys.argv", ["jobright_scrape.py", *argv])
+
+    js.main()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    snapped = [t["to"] for t in report["transitions"]]
+    assert [s for s in snapped if s.startswith("page.")] == [
+        "page.decode#1", "page.extract#1", "page.decode#2", "page.extract#2", "page.decode#4", "page.extract#4"
+    ]
+    decodes = [s for s in report["stages"] if s["stage"].startswith("page.decode")]
+    assert len(decodes) == 4 and all(s["streamed"] for s in decodes)
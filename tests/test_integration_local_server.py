@@ -1,7 +1,6 @@
-import os, json, pytest, threading
+import os, json, pytest
 import jobright_scrape as js
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import parse_qs, urlparse
+from benchmarks.fake_server import FakeJobright
 
 pytestmark = pytest.mark.integration
 
@@ -11,90 +10,6 @@ if os.getenv("RUN_PLAYWRIGHT_INTEGRATION") != "1":
 
 pytest.importorskip("playwright.sync_api")
 
-class _Server:
-    def __init__(self, mode: str):
-        self.mode = mode
-        self.httpd = None
-        self.thread = None
-        self.base_url = None
-
-    def start(self):
-        mode = self.mode
-
-        class Handler(BaseHTTPRequestHandler):
-            def _send(self, code: int, body: bytes, content_type: str):
-                self.send_response(code)
-                self.send_header("Content-Type", content_type)
-                self.send_header("Content-Length", str(len(body)))
-                self.end_headers()
-                self.wfile.write(body)
-
-            def log_message(self, fmt, *args):
-                return
-
-            def do_GET(self):
-                parsed = urlparse(self.path)
-
-                if parsed.path == "/jobs/recommend":
-                    body = b"<html><body>recommendations</body></html>"
-                    return self._send(200, body, "text/html; charset=utf-8")
-
-                if parsed.path == "/swan/recommend/list/jobs":
-                    if mode == "forbidden":
-                        return self._send(403, b'{"error":"forbidden"}', "application/json")
-
-                    qs = parse_qs(parsed.query)
-                    count = int(qs.get("count", ["10"])[0])
-
-                    jobs = []
-                    for i in range(count):
-                        job_id = f"job-{i}"
-                        jobs.append(
-                            {
-                                "jobInfoId": job_id,
-                                "jobTitle": "Software Engineer",
-                                "companyName": "Acme",
-                                "jobLocation": "Remote",
-                                "applyUrl": "/apply/123",
-                                "detailUrl": f"/jobs/info/{job_id}",
-                                "socialConnections": [
-                                    {
-                                        "fullName": "Jane Recruiter",
-                                        "jobTitle": "Technical Recruiter",
-                                        "companyName": "Acme",
-                                        "linkedinUrl": "https://linkedin.com/in/jane",
-                                    },
-                                    {
-                                        "fullName": "Bob Engineer",
-                                        "jobTitle": "Software Engineer",
-                                        "companyName": "Acme",
-                                        "linkedinUrl": "https://linkedin.com/in/bob",
-                                    },
-                                ],
-                                "jdCoreSkills": [{"skill": "Python"}, {"skill": "SQL"}],
-                                "recommendationTags": ["New Grad", "Remote"],
-                            }
-                        )
-
-                    payload = {"data": {"jobs": jobs}}
-                    body = json.dumps(payload).encode("utf-8")
-                    return self._send(200, body, "application/json; charset=utf-8")
-
-                return self._send(404, b"not found", "text/plain; charset=utf-8")
-
-        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
-        port = httpd.server_address[1]
-        self.httpd = httpd
-        self.base_url = f"http://127.0.0.1:{port}"
-
-        t = threading.Thread(target=httpd.serve_forever, daemon=True)
-        t.start()
-        self.thread = t
-
-    def stop(self):
-        if self.httpd:
-            self.httpd.shutdown()
-
 
 @pytest.fixture()
 def state_file(tmp_path):
@@ -104,15 +19,12 @@ def state_file(tmp_path):
 
 
 def test_fetch_recommendations_integration_ok(tmp_path, monkeypatch, state_file):
-    srv = _Server(mode="ok")
-    srv.start()
+    srv = FakeJobright().start()
     try:
         monkeypatch.chdir(tmp_path)
 
         monkeypatch.setattr(js, "STATE_FILE", str(state_file))
-        monkeypatch.setattr(js, "BASE", srv.base_url)
-        monkeypatch.setattr(js, "RECS_PAGE", f"{srv.base_url}/jobs/recommend")
-        monkeypatch.setattr(js, "RECS_API", f"{srv.base_url}/swan/recommend/list/jobs")
+        srv.patch(monkeypatch, js)
 
         jobs = js.fetch_recommendations_via_api(max_items=3, page_size=3)
 
@@ -137,15 +49,12 @@ def test_fetch_recommendations_integration_ok(tmp_path, monkeypatch, state_file)
 
 
 def test_fetch_recommendations_integration_forbidden(tmp_path, monkeypatch, state_file):
-    srv = _Server(mode="forbidden")
-    srv.start()
+    srv = FakeJobright(status=403).start()
     try:
         monkeypatch.chdir(tmp_path)
 
         monkeypatch.setattr(js, "STATE_FILE", str(state_file))
-        monkeypatch.setattr(js, "BASE", srv.base_url)
-        monkeypatch.setattr(js, "RECS_PAGE", f"{srv.base_url}/jobs/recommend")
-        monkeypatch.setattr(js, "RECS_API", f"{srv.base_url}/swan/recommend/list/jobs")
+        srv.patch(monkeypatch, js)
 
         with pytest.raises(PermissionError) as e:
             js.fetch_recommendations_via_api(max_items=1, page_size=1)
@@ -0,0 +1,211 @@
+import json, pytest, sqlite3
+import jobright_scrape as js
+from urllib.parse import parse_qs, urlparse
+
+
+def _record(job_id, title="SWE", company="Acme", **extra):
+    r = {
+        "jobId": job_id,
+        "title": title,
+        "company": company,
+        "location": "Remote",
+        "jobright_url": f"https://jobright.ai/jobs/info/{job_id}",
+        "apply_url": None,
+        "linkedin_recruiters": [],
+        "keywords": ["Python"],
+    }
+    r.update(extra)
+    return r
+
+
+def test_sqlite_sink_upserts_and_keeps_first_seen(tmp_path, monkeypatch):
+    path = str(tmp_path / "jobs.db")
+    sink = js._SqliteSink(path)
+    sink([_record("1", raw={"a": 1}), _record("2"), _record(None)])
+    sink.close()
+
+    db = sqlite3.connect(path)
+    db.execute("UPDATE jobs SET first_seen = '2000-01-01T00:00:00+00:00', last_seen = '2000-01-01T00:00:00+00:00'")
+    db.commit()
+
+    sink = js._SqliteSink(path)
+    sink([_record("1", title="Senior SWE")])
+    sink.close()
+
+    rows = {r[0]: r for r in db.execute("SELECT jobId, title, keywords, raw, first_seen, last_seen FROM jobs")}
+    assert set(rows) == {"1", "2"}
+    assert rows["1"][1] == "Senior SWE"
+    assert json.loads(rows["1"][2]) == ["Python"]
+    assert json.loads(rows["1"][3]) == {"a": 1}
+    assert rows["1"][4] == "2000-01-01T00:00:00+00:00"
+    assert rows["1"][5] > rows["1"][4]
+    assert rows["2"][5] == "2000-01-01T00:00:00+00:00"
+
+    indexes = {r[0] for r in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_jobs_company", "idx_jobs_location", "idx_jobs_first_seen", "idx_jobs_last_seen"} <= indexes
+
+
+def _page(*ids):
+    jobs = [{"jobInfoId": i, "jobTitle": "SWE", "companyName": "Acme"} for i in ids]
+    return json.dumps({"data": {"jobs": jobs}}).encode("utf-8")
+
+
+def test_incremental_skips_known_jobs_and_stops_after_a_known_run(tmp_path):
+    store = js._SeenStore(str(tmp_path / "seen.db"))
+    store.add_many(["3", "4", "5", "6", "7"])
+
+    pg = js._Pagination(max_items=50, sort_condition=0, page_size=4, known=store, stop_after_known=3)
+    pg.consume("u", 4, 200, _page("1", "2", "3", "8"))
+    assert not pg.done
+    pg.consume("u", 4, 200, _page("4", "5", "9", "6"))
+    assert not pg.done
+    pg.consume("u", 4, 200, _page("10", "7", "4", "3", "11"))
+    assert pg.done
+
+    assert [r["jobId"] for r in pg.out] == ["1", "2", "8", "9", "10"]
+    assert len(store) == 10
+    store.close()
+
+    again = js._SeenStore(str(tmp_path / "seen.db"))
+    assert "9" in again and "99" not in again
+    again.close()
+
+
+def test_incremental_does_not_remember_jobs_a_sink_failed_to_write(tmp_path):
+    store = js._SeenStore(str(tmp_path / "seen.db"))
+
+    def broken(records):
+        raise OSError("disk full")
+
+    pg = js._Pagination(max_items=50, sort_condition=0, page_size=3, sinks=[broken], known=store, stop_after_known=3)
+    with pytest.raises(OSError):
+        pg.consume("u", 3, 200, _page("a", "b", "c"))
+    assert len(store) == 0
+
+    written = []
+    pg = js._Pagination(max_items=3, sort_condition=0, page_size=3, sinks=[written.extend], known=store)
+    pg.consume("u", 3, 200, _page("a", "b", "c"))
+    assert [r["jobId"] for r in written] == ["a", "b", "c"]
+    assert len(store) == 3
+    store.close()
+
+
+def test_bloom_filter_has_no_false_negatives_and_round_trips(tmp_path):
+    bf = js._BloomFilter(capacity=5_000, error_rate=0.01)
+    for i in range(5_000):
+        bf.add(f"job-{i}")
+
+    assert all(f"job-{i}" in bf for i in range(5_000))
+    false_positives = sum(f"other-{i}" in bf for i in range(5_000))
+    assert false_positives < 150
+
+    path = str(tmp_path / "f.bloom")
+    bf.save(path)
+    loaded = js._BloomFilter.load(path)
+    assert (loaded.capacity, loaded.m, loaded.k, loaded.count) == (bf.capacity, bf.m, bf.k, bf.count)
+    assert "job-42" in loaded
+
+
+def test_seen_store_consults_sqlite_only_on_filter_hits_and_rebuilds_stale_filter(tmp_path):
+    path = str(tmp_path / "seen.db")
+    store = js._SeenStore(path, bloom_capacity=1_000)
+    store.add_many(["a", "b", "a"])
+    assert store.bloom.count == 2
+
+    assert "zzz-not-there" not in store
+    assert store.exact_checks <= 1
+    assert "a" in store
+    store.close()
+
+    # Simulate a crash after more IDs were committed but before the filter was saved.
+    db = sqlite3.connect(path)
+    db.execute("INSERT INTO seen VALUES ('c', 'now')")
+    db.commit()
+    db.close()
+
+    reopened = js._SeenStore(path, bloom_capacity=1_000)
+    assert reopened.bloom.count == 3
+    assert "c" in reopened
+    reopened.close()
+
+
+def test_checkpoint_resume_continues_where_a_crashed_run_stopped(tmp_path):
+    requested = []
+
+    def get(url, fail_at=None):
+        qs = parse_qs(urlparse(url).query)
+        position, count = int(qs["position"][0]), int(qs["count"][0])
+        requested.append((position, qs["refresh"][0]))
+        if position == fail_at:
+            raise TimeoutError("boom")
+        return 200, _page(*[f"job-{position + i}" for i in range(count)])
+
+    path = str(tmp_path / "ckpt.json")
+    cp = js._Checkpoint(path)
+    with pytest.raises(TimeoutError):
+        js._paginate(lambda u: get(u, fail_at=9), max_items=20, sort_condition=0, page_size=3, checkpoint=cp)
+    cp.close()
+    assert json.loads(open(path).read())["position"] == 9
+
+    requested.clear()
+    cp = js._Checkpoint(path, resume=True)
+    jobs = js._paginate(get, max_items=20, sort_condition=0, page_size=3, checkpoint=cp)
+    cp.finish()
+
+    assert requested[0] == (9, "false")
+    assert [j["jobId"] for j in jobs] == [f"job-{i}" for i in range(20)]
+    assert not (tmp_path / "ckpt.json").exists()
+    assert not (tmp_path / "ckpt.json.records.ndjson").exists()
+
+
+def test_stream_parse_pagination_matches_full_parse():
+    bodies = [_page("1", "2", "3"), _page("3", "4", "5")]
+
+    results = []
+    for stream in (False, True):
+        pg = js._Pagination(max_items=10, sort_condition=0, page_size=3, stream_parse=stream)
+        for body in bodies:
+            pg.consume("u", 3, 200, body)
+        results.append([r["jobId"] for r in pg.out])
+
+    assert results[0] == results[1] == ["1", "2", "3", "4", "5"]
+
+
+def test_stream_parse_finds_jobs_outside_arrays():
+    job = {"jobInfoId": "7", "jobTitle": "SWE", "companyName": "Acme"}
+    bodies = [json.dumps({"data": {"job": job}}).encode(), json.dumps(dict(job, jobInfoId="8")).encode()]
+
+    results = []
+    for stream in (False, True):
+        pg = js._Pagination(max_items=10, sort_condition=0, page_size=1, stream_parse=stream)
+        for body in bodies:
+            pg.consume("u", 1, 200, body)
+        results.append([r["jobId"] for r in pg.out])
+
+    assert results[0] == results[1] == ["7", "8"]
+
+
+def test_json_backends_keep_default_output_byte_identical(tmp_path):
+    jobs = [_record("1", title="Café ☃", raw={"n": 1.5, "big": 2**70, "nested": [None, True]})]
+    expected = json.dumps(jobs, indent=2)
+
+    backends = ["stdlib"] + (["orjson"] if js.orjson is not None else [])
+    try:
+        for backend in backends:
+            js.set_json_backend(backend)
+
+            js._json_write(str(tmp_path / "out.json"), jobs)
+            assert (tmp_path / "out.json").read_text(encoding="utf-8") == expected
+            assert js._json_dumps(jobs[0]) == json.dumps(jobs[0])
+
+            js._json_write(str(tmp_path / "compact.json"), jobs[:1][0]["keywords"], compact=True)
+            assert (tmp_path / "compact.json").read_text(encoding="utf-8") == '["Python"]'
+            assert json.loads(js._json_dumps(jobs[0]["raw"], compact=True)) == jobs[0]["raw"]
+
+            assert js._json_loads(b'{"a": NaN, "b": 123456789012345678901234567890}')["b"] == 123456789012345678901234567890
+    finally:
+        js.set_json_backend("auto")
+
+    if js.orjson is None:
+        with pytest.raises(ImportError):
+            js.set_json_backend("orjson")